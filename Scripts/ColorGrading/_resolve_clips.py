@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Shared clip selection helpers for the ColorGrading scripts.
+
+Imported by the scripts in this directory; not meant to be run directly.
+
+Author: DaVinci Resolve Automation Project
+License: MIT
+"""
+
+import sys
+from typing import Any, Dict, List, Optional, Set
+
+# Resolve clip colors, lowercased and interned so filters compare with `is`
+_COLOR_CANON = {
+    name: sys.intern(name) for name in (
+        'orange', 'apricot', 'yellow', 'lime', 'olive', 'green', 'teal', 'navy',
+        'blue', 'purple', 'violet', 'pink', 'tan', 'beige', 'brown', 'chocolate',
+    )
+}
+
+
+def _canon_color(color: str) -> str:
+    """Lowercase and intern a clip color name."""
+    lower = color.lower()
+    return _COLOR_CANON.get(lower) or sys.intern(lower)
+
+
+def get_items_by_track(timeline, target_track: Optional[int] = None) -> Dict[int, List[Any]]:
+    """
+    Fetch video track contents once, keyed by track index.
+
+    Only the requested track is fetched when target_track is given.
+    """
+    if target_track:
+        track_range = [target_track]
+    else:
+        track_range = range(1, timeline.GetTrackCount('video') + 1)
+
+    return {
+        track_index: timeline.GetItemListInTrack('video', track_index) or []
+        for track_index in track_range
+    }
+
+
+def _cached(item, field: str, clip_meta: Optional[Dict[int, Dict[str, Any]]]):
+    """Look up a clip's name or color in clip_meta, falling back to Resolve."""
+    if clip_meta is not None:
+        meta = clip_meta.get(id(item))
+        if meta is not None and field in meta:
+            return meta[field]
+    return item.GetClipColor() if field == 'color' else item.GetName()
+
+
+def select_clips(
+    items_by_track: Dict[int, List[Any]],
+    *,
+    track: Optional[int] = None,
+    color: Optional[str] = None,
+    exclude_ids: Optional[Set[int]] = None,
+    names_out: Optional[Dict[str, Any]] = None,
+    clip_meta: Optional[Dict[int, Dict[str, Any]]] = None
+) -> List[Any]:
+    """
+    Filter already fetched track contents without re-querying tracks.
+
+    Args:
+        items_by_track: Track contents from get_items_by_track()
+        track: Only select clips on this track
+        color: Only select clips with this clip color (case-insensitive)
+        exclude_ids: id() of clips to skip; must be the same objects as
+            the items in items_by_track
+        names_out: If given, filled with name -> clip for the selected
+            clips in the same pass (first clip wins on repeated names)
+        clip_meta: Optional id(clip) -> {'name': ..., 'color': ...} cache;
+            cached values are used instead of asking Resolve again
+
+    Returns:
+        List of matching clips in track order
+    """
+    clips = []
+    color_canon = _canon_color(color) if color else None
+    track_range = [track] if track else sorted(items_by_track)
+
+    for track_index in track_range:
+        items = items_by_track.get(track_index, [])
+
+        if exclude_ids:
+            items = [item for item in items if id(item) not in exclude_ids]
+
+        if color_canon:
+            colors = [_cached(item, 'color', clip_meta) for item in items]
+            items = [
+                item for item, clip_color in zip(items, colors)
+                if clip_color and _canon_color(clip_color) is color_canon
+            ]
+
+        if names_out is not None:
+            for item in items:
+                names_out.setdefault(_cached(item, 'name', clip_meta), item)
+
+        clips.extend(items)
+
+    return clips
+
+
+def get_target_clips(
+    timeline,
+    *,
+    target_all: bool = False,
+    target_track: Optional[int] = None,
+    target_color: Optional[str] = None
+) -> List[Any]:
+    """
+    Get target clips based on criteria.
+
+    Args:
+        timeline: Timeline object
+        target_all: Target all clips
+        target_track: Target specific track
+        target_color: Target clips with specific color (case-insensitive)
+
+    Returns:
+        List of TimelineItem objects
+    """
+    return select_clips(
+        get_items_by_track(timeline, target_track),
+        track=target_track,
+        color=target_color
+    )
@@ -7,6 +7,7 @@ DRXテンプレート適用スクリプト
 
 import sys
 import os
+import argparse
 
 # DaVinci Resolve API のパスを設定
 RESOLVE_SCRIPT_API = "/Library/Application Support/Blackmagic Design/DaVinci Resolve/Developer/Scripting"
@@ -16,6 +17,9 @@ os.environ["RESOLVE_SCRIPT_API"] = RESOLVE_SCRIPT_API
 os.environ["RESOLVE_SCRIPT_LIB"] = RESOLVE_SCRIPT_LIB
 sys.path.append(f"{RESOLVE_SCRIPT_API}/Modules")
 
+# DRXファイルパス
+DRX_PATH = os.path.expanduser("~/Projects/cinematic-lut-analyzer/templates/braw_cinematic_base.drx")
+
 try:
     import DaVinciResolveScript as dvr_script
 except ImportError as e:
@@ -23,8 +27,35 @@ except ImportError as e:
     sys.exit(1)
 
 
+def get_node_info(graph, num_nodes):
+    """
+    各ノードのラベルとLUTを取得
+
+    ノードごとにAPI呼び出しが2回発生するため、--show-nodes 指定時のみ使用します
+
+    Returns:
+        {ノード番号: (ラベル, LUT)} の辞書
+    """
+    node_info = {}
+    for i in range(1, num_nodes + 1):
+        try:
+            node_info[i] = (graph.GetNodeLabel(i), graph.GetLUT(i))
+        except (AttributeError, TypeError, RuntimeError) as e:
+            print(f"⚠️  ノード{i}の情報取得に失敗: {e}")
+            break
+    return node_info
+
+
 def main():
     """メイン処理"""
+    parser = argparse.ArgumentParser(description="DRXテンプレートを先頭のタイムラインアイテムに適用")
+    parser.add_argument(
+        '--show-nodes',
+        action='store_true',
+        help='適用後の各ノードのラベルとLUTを表示'
+    )
+    args = parser.parse_args()
+
     print("=" * 70)
     print("🎨 DRXテンプレート適用ツール")
     print("=" * 70)
@@ -53,13 +84,14 @@ def main():
         print("❌ タイムラインがありません")
         sys.exit(1)
 
-    timeline_items = timeline.GetItemListInTrack("video", 1)
-    if not timeline_items or len(timeline_items) == 0:
+    timeline_items = timeline.GetItemListInTrack("video", 1) or []
+    if not timeline_items:
         print("❌ タイムラインアイテムがありません")
         sys.exit(1)
 
+    item_count = len(timeline_items)
     first_item = timeline_items[0]
-    print(f"✅ タイムラインアイテム取得完了: {len(timeline_items)}個")
+    print(f"✅ タイムラインアイテム取得完了: {item_count}個")
 
     # ノードグラフを取得
     print("\n[3/5] ノードグラフを取得中...")
@@ -71,8 +103,7 @@ def main():
     current_nodes = graph.GetNumNodes()
     print(f"✅ 現在のノード数: {current_nodes}")
 
-    # DRXファイルパス
-    drx_path = os.path.expanduser("~/Projects/cinematic-lut-analyzer/templates/braw_cinematic_base.drx")
+    drx_path = DRX_PATH
 
     print(f"\n[4/5] DRXテンプレートを確認中...")
     if not os.path.exists(drx_path):
@@ -104,15 +135,14 @@ def main():
         new_nodes = graph.GetNumNodes()
         print(f"\n適用後のノード数: {new_nodes}")
 
-        # 各ノードのラベルを表示
-        print("\nノード構成:")
-        for i in range(1, new_nodes + 1):
-            label = graph.GetNodeLabel(i)
-            lut = graph.GetLUT(i)
-            if lut:
-                print(f"  ノード{i}: {label} (LUT: {lut})")
-            else:
-                print(f"  ノード{i}: {label}")
+        # 各ノードのラベルを表示（--show-nodes 指定時のみ）
+        if args.show_nodes:
+            print("\nノード構成:")
+            for i, (label, lut) in get_node_info(graph, new_nodes).items():
+                if lut:
+                    print(f"  ノード{i}: {label} (LUT: {lut})")
+                else:
+                    print(f"  ノード{i}: {label}")
     else:
         print("❌ DRXテンプレート適用失敗")
         print("DRXファイルが正しい形式か確認してください")
@@ -18,6 +18,9 @@ Usage Examples:
     # Apply to clips with specific color
     python3 batch_grade_apply.py --lut film.cube --node 4 --color Orange
 
+    # Apply to clips with any of several colors
+    python3 batch_grade_apply.py --lut film.cube --node 4 --color Orange,Red
+
     # Apply CDL adjustments
     python3 batch_grade_apply.py --cdl-slope "1.2 1.0 1.0" --node 1 --all
 
@@ -28,21 +31,75 @@ License: MIT
 import sys
 import os
 import argparse
-from typing import List, Optional
+import platform
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
 
 # Add DaVinci Resolve API to path
 api_path = os.environ.get('RESOLVE_SCRIPT_API')
 if api_path:
     sys.path.append(os.path.join(api_path, "Modules"))
 
+# Per-run cache of track item lists, keyed by (track_type, track_index).
+# Cleared at the start of every main() invocation.
+_track_cache: Dict[Tuple[str, int], List] = {}
+
+# Clip colors keyed by id(item). Items stay referenced by _track_cache, so
+# ids are stable; both caches are cleared together.
+_color_cache: Dict[int, str] = {}
+
+# RefreshLUTList() rescans the LUT directory on disk; do it at most once
+# per main() invocation
+_lut_refreshed = False
+
+
+def _get_items(timeline, track_type: str, track_index: int) -> List:
+    """
+    Get the items in a track, reusing earlier results from this main() run.
+
+    Args:
+        timeline: Timeline object
+        track_type: "video" or "audio"
+        track_index: Track number (1-based)
+
+    Returns:
+        List of TimelineItem objects (empty list if the track is empty)
+    """
+    key = (track_type, track_index)
+    if key not in _track_cache:
+        _track_cache[key] = timeline.GetItemListInTrack(track_type, track_index) or []
+
+    return _track_cache[key]
+
+
+def _color_of(item) -> str:
+    """
+    Get a clip's color, calling GetClipColor() at most once per item.
+
+    Only valid for items obtained through _get_items(), which owns the
+    cache lifetime.
 
-def get_clips_by_color(timeline, color_name: str) -> List:
+    Args:
+        item: TimelineItem object
+
+    Returns:
+        Clip color name (empty string if none)
+    """
+    key = id(item)
+    color = _color_cache.get(key)
+    if color is None:
+        color = _color_cache[key] = item.GetClipColor() or ""
+    return color
+
+
+def get_clips_by_color(timeline, colors: FrozenSet[str]) -> List:
     """
-    Get timeline clips by color.
+    Get timeline clips matching any of the given colors.
 
     Args:
         timeline: Timeline object
-        color_name: Clip color to filter (e.g., "Orange", "Blue")
+        colors: Clip colors to filter (e.g., frozenset({"Orange", "Red"}))
 
     Returns:
         List of TimelineItem objects
@@ -52,11 +109,9 @@ def get_clips_by_color(timeline, color_name: str) -> List:
     # Check video tracks
     video_track_count = timeline.GetTrackCount("video")
     for track_index in range(1, video_track_count + 1):
-        items = timeline.GetItemListInTrack("video", track_index)
-        if items:
-            for item in items:
-                if item.GetClipColor() == color_name:
-                    clips.append(item)
+        for item in _get_items(timeline, "video", track_index):
+            if _color_of(item) in colors:
+                clips.append(item)
 
     return clips
 
@@ -73,134 +128,290 @@ def get_clips_by_track(timeline, track_type: str, track_index: int) -> List:
     Returns:
         List of TimelineItem objects
     """
-    items = timeline.GetItemListInTrack(track_type, track_index)
-    return items if items else []
+    return list(_get_items(timeline, track_type, track_index))
 
 
-def get_all_video_clips(timeline) -> List:
+def iter_all_video_clips(timeline) -> Iterator:
     """
-    Get all video clips from timeline.
+    Iterate over all video clips in timeline, track by track.
 
     Args:
         timeline: Timeline object
 
-    Returns:
-        List of all video TimelineItem objects
+    Yields:
+        Video TimelineItem objects
     """
-    clips = []
-    video_track_count = timeline.GetTrackCount("video")
+    for track_index in range(1, timeline.GetTrackCount("video") + 1):
+        yield from _get_items(timeline, "video", track_index)
 
-    for track_index in range(1, video_track_count + 1):
-        items = timeline.GetItemListInTrack("video", track_index)
-        if items:
-            clips.extend(items)
 
-    return clips
+def refresh_lut_list(project) -> None:
+    """
+    Refresh the project's LUT list, skipping repeat calls in this run.
+
+    Args:
+        project: Project object
+    """
+    global _lut_refreshed
+
+    if not _lut_refreshed:
+        project.RefreshLUTList()
+        _lut_refreshed = True
+
+
+def get_lut_directory() -> Optional[str]:
+    """
+    Get platform-specific LUT directory for DaVinci Resolve.
+
+    Returns:
+        Absolute path to LUT directory, or None on unsupported platforms
+    """
+    system = platform.system()
+
+    if system == "Darwin":
+        return "/Library/Application Support/Blackmagic Design/DaVinci Resolve/LUT"
+    elif system == "Windows":
+        return "C:\\ProgramData\\Blackmagic Design\\DaVinci Resolve\\Support\\LUT"
+    elif system == "Linux":
+        for path in (os.path.expanduser("~/.local/share/DaVinciResolve/LUT"), "/opt/resolve/LUT"):
+            if os.path.isdir(path):
+                return path
+    return None
 
 
-def apply_drx_to_clips(clips: List, drx_path: str) -> int:
+def parse_color_list(value: str) -> FrozenSet[str]:
     """
-    Apply DRX template to clips.
+    Parse a comma-separated clip color list (e.g., "Orange,Red").
 
     Args:
-        clips: List of TimelineItem objects
-        drx_path: Path to DRX file
+        value: Color list string
 
     Returns:
-        Number of successful applications
+        Set of color names
     """
-    if not os.path.isfile(drx_path):
-        print(f"❌ DRX file not found: {drx_path}")
-        return 0
+    colors = frozenset(c.strip() for c in value.split(",") if c.strip())
+    if not colors:
+        raise argparse.ArgumentTypeError("at least one color is required")
+    return colors
 
-    success_count = 0
 
-    for clip in clips:
-        graph = clip.GetNodeGraph()
-        if graph and graph.ApplyGradeFromDRX(drx_path, 0):
-            success_count += 1
-            print(f"  ✅ DRX applied: {clip.GetName()}")
-        else:
-            print(f"  ❌ DRX failed: {clip.GetName()}")
+def parse_cdl_values(value: str, count: int) -> Tuple[float, ...]:
+    """
+    Parse a space-separated CDL value string.
 
-    return success_count
+    Args:
+        value: Value string (e.g., "1.2 1.0 1.0")
+        count: Expected number of values
 
+    Returns:
+        Tuple of floats
 
-def apply_lut_to_clips(clips: List, lut_filename: str, node_index: int) -> int:
+    Raises:
+        ValueError: If the string does not contain exactly `count` numbers
     """
-    Apply LUT to clips.
+    parts = value.split()
+    if len(parts) != count:
+        raise ValueError(f"expected {count} value(s), got {len(parts)}: {value!r}")
+    return tuple(float(part) for part in parts)
+
+
+def format_cdl_values(values: Tuple[float, ...]) -> str:
+    """
+    Format parsed CDL values as the canonical string passed to SetCDL.
 
     Args:
-        clips: List of TimelineItem objects
-        lut_filename: LUT filename (not full path)
-        node_index: Node index to apply LUT (1-based)
+        values: Parsed values (e.g., (1.2, 1.0, 1.0))
 
     Returns:
-        Number of successful applications
+        Space-separated values with fixed precision (e.g., "1.200000 1.000000 1.000000")
     """
-    success_count = 0
+    return " ".join(f"{v:.6f}" for v in values)
 
-    for clip in clips:
-        if clip.SetLUT(node_index, lut_filename):
-            success_count += 1
-            print(f"  ✅ LUT applied: {clip.GetName()}")
-        else:
-            print(f"  ❌ LUT failed: {clip.GetName()}")
 
-    return success_count
+def validate_args(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    """
+    Validate grading inputs before any clip is touched.
 
+    CDL strings are replaced in-place on `args` by parsed float tuples.
 
-def apply_cdl_to_clips(
-    clips: List,
+    Args:
+        parser: Argument parser (used to report errors)
+        args: Parsed arguments
+    """
+    if args.drx:
+        args.drx = os.path.expanduser(args.drx)
+        if not os.path.isfile(args.drx):
+            parser.error(f"DRX file not found: {args.drx}")
+
+    for name, count in (("cdl_slope", 3), ("cdl_offset", 3),
+                        ("cdl_power", 3), ("cdl_saturation", 1)):
+        value = getattr(args, name)
+        if value:
+            try:
+                setattr(args, name, parse_cdl_values(value, count))
+            except ValueError as e:
+                option = "--" + name.replace("_", "-")
+                parser.error(f"invalid {option}: {e}")
+
+    if args.lut and not os.path.isfile(args.lut):
+        lut_dir = get_lut_directory()
+        if lut_dir and not os.path.isfile(os.path.join(lut_dir, args.lut)):
+            print(f"⚠️  LUT not found in {lut_dir}: {args.lut}")
+
+
+def build_cdl_map(
     node_index: int,
-    slope: Optional[str] = None,
-    offset: Optional[str] = None,
-    power: Optional[str] = None,
-    saturation: Optional[str] = None
-) -> int:
+    slope: Optional[Tuple[float, ...]] = None,
+    offset: Optional[Tuple[float, ...]] = None,
+    power: Optional[Tuple[float, ...]] = None,
+    saturation: Optional[Tuple[float, ...]] = None
+) -> Optional[Dict[str, str]]:
     """
-    Apply CDL values to clips.
+    Build the SetCDL argument map.
 
     Args:
-        clips: List of TimelineItem objects
         node_index: Node index (1-based)
-        slope: Slope values "R G B" (e.g., "1.2 1.0 1.0")
-        offset: Offset values "R G B"
-        power: Power values "R G B"
-        saturation: Saturation value (e.g., "1.1")
+        slope: Slope values (R, G, B)
+        offset: Offset values (R, G, B)
+        power: Power values (R, G, B)
+        saturation: Saturation value (S,)
 
     Returns:
-        Number of successful applications
+        CDL map, or None if no CDL values were specified
     """
     cdl_map = {"NodeIndex": str(node_index)}
 
     if slope:
-        cdl_map["Slope"] = slope
+        cdl_map["Slope"] = format_cdl_values(slope)
     if offset:
-        cdl_map["Offset"] = offset
+        cdl_map["Offset"] = format_cdl_values(offset)
     if power:
-        cdl_map["Power"] = power
+        cdl_map["Power"] = format_cdl_values(power)
     if saturation:
-        cdl_map["Saturation"] = saturation
+        cdl_map["Saturation"] = format_cdl_values(saturation)
 
     if len(cdl_map) == 1:  # Only NodeIndex
-        print("⚠️  No CDL values specified")
-        return 0
+        return None
 
-    success_count = 0
+    return cdl_map
 
-    for clip in clips:
-        if clip.SetCDL(cdl_map):
-            success_count += 1
-            print(f"  ✅ CDL applied: {clip.GetName()}")
-        else:
-            print(f"  ❌ CDL failed: {clip.GetName()}")
 
-    return success_count
+@dataclass(frozen=True)
+class DRXOp:
+    """Apply a DRX grade template (whole node graph)."""
+    path: str
+    kind = "drx"
+    needs_graph = True
+
+    def apply(self, clip, graph) -> bool:
+        return bool(graph and graph.ApplyGradeFromDRX(self.path, 0))
 
 
-def main():
-    """Main entry point."""
+@dataclass(frozen=True)
+class LUTOp:
+    """Apply a LUT to a single node."""
+    name: str
+    node: int
+    kind = "lut"
+    needs_graph = False
+
+    def apply(self, clip, graph) -> bool:
+        return bool(clip.SetLUT(self.node, self.name))
+
+
+@dataclass(frozen=True)
+class CDLOp:
+    """Apply a prebuilt SetCDL map."""
+    cdl_map: Dict[str, str]
+    kind = "cdl"
+    needs_graph = False
+
+    def apply(self, clip, graph) -> bool:
+        return bool(clip.SetCDL(self.cdl_map))
+
+
+def apply_ops_to_clip(clip, ops: List, needs_graph: bool = True) -> List[Tuple[str, bool]]:
+    """
+    Apply a sequence of grading operations to a single clip.
+
+    Args:
+        clip: TimelineItem object
+        ops: Ordered DRXOp/LUTOp/CDLOp operations
+        needs_graph: Whether any op needs the clip's node graph; when False
+                     the GetNodeGraph() call is skipped
+
+    Returns:
+        List of (operation kind, success) tuples in op order
+    """
+    graph = clip.GetNodeGraph() if needs_graph else None
+    return [(op.kind, op.apply(clip, graph)) for op in ops]
+
+
+def apply_ops_to_clips(
+    clips: Iterable,
+    ops: List,
+    verbose: bool = False,
+    jobs: int = 1,
+    dry_run: bool = False
+) -> Tuple[Dict[str, int], int]:
+    """
+    Apply a sequence of grading operations to clips in a single pass.
+
+    Each clip's node graph is fetched at most once (only when a DRX op is
+    present) and shared by all operations, so a clip receiving DRX+LUT+CDL
+    is visited only once. With jobs > 1,
+    clips are dispatched concurrently so API round-trips overlap.
+
+    Args:
+        clips: Iterable of TimelineItem objects (consumed once)
+        ops: Ordered operations, e.g. [DRXOp(path), LUTOp(name, node),
+             CDLOp(cdl_map)]
+        verbose: If True, print a per-clip report after processing
+        jobs: Number of clips to process concurrently (1 = sequential)
+        dry_run: If True, only count the clips that would be graded
+
+    Returns:
+        Tuple of (successful applications per operation kind, clips processed)
+    """
+    needs_graph = any(op.needs_graph for op in ops)
+
+    def apply_one(clip):
+        return clip, apply_ops_to_clip(clip, ops, needs_graph)
+
+    if dry_run:
+        per_clip = [(clip, [(op.kind, True) for op in ops]) for clip in clips]
+    elif jobs > 1:
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            per_clip = list(executor.map(apply_one, clips))
+    else:
+        per_clip = [apply_one(clip) for clip in clips]
+
+    success_counts = {op.kind: 0 for op in ops}
+    results = []
+
+    for clip, clip_results in per_clip:
+        for kind, ok in clip_results:
+            if ok:
+                success_counts[kind] += 1
+            results.append((kind, ok, clip))
+
+    # Clip names are only fetched (one API call each) when requested
+    if verbose:
+        lines = []
+        for kind, ok, clip in results:
+            if dry_run:
+                lines.append(f"  Would apply {kind.upper()}: {clip.GetName()}")
+            elif ok:
+                lines.append(f"  ✅ {kind.upper()} applied: {clip.GetName()}")
+            else:
+                lines.append(f"  ❌ {kind.upper()} failed: {clip.GetName()}")
+        print("\n".join(lines))
+
+    return success_counts, len(per_clip)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser."""
     parser = argparse.ArgumentParser(
         description="Batch apply grading to DaVinci Resolve timeline clips",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -215,11 +426,17 @@ Examples:
   # Apply to orange-colored clips only
   %(prog)s --lut film.cube --node 4 --color Orange
 
+  # Apply to orange- or red-colored clips in one pass
+  %(prog)s --lut film.cube --node 4 --color Orange,Red
+
   # Apply CDL adjustments
   %(prog)s --cdl-slope "1.2 1.0 1.0" --cdl-saturation "1.1" --node 1 --all
 
   # Combine DRX and LUT
   %(prog)s --drx base.drx --lut film.cube --node 4 --track 1
+
+  # Preview which clips would be graded
+  %(prog)s --lut film.cube --node 4 --color Orange --dry-run -v
         """
     )
 
@@ -238,9 +455,9 @@ Examples:
     )
     target_group.add_argument(
         '--color',
-        type=str,
-        metavar='COLOR',
-        help='Apply to clips with specific color (e.g., Orange, Blue)'
+        type=parse_color_list,
+        metavar='COLOR[,COLOR...]',
+        help='Apply to clips with any of the given colors (e.g., Orange or Orange,Red)'
     )
 
     # Grading operations
@@ -295,13 +512,78 @@ Examples:
         help='CDL Saturation value (e.g., "1.1")'
     )
 
-    args = parser.parse_args()
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=1,
+        metavar='N',
+        help='Number of clips to process concurrently (default: 1)'
+    )
+
+    parser.add_argument(
+        '--dry-run',
+        action='store_true',
+        help='Select clips and validate inputs without modifying any grades'
+    )
+
+    parser.add_argument(
+        '-v', '--verbose',
+        action='store_true',
+        help='Show per-clip results'
+    )
+
+    return parser
+
+
+_PARSER = _build_parser()
+
+# Resolve connection, reused across main() calls in the same process
+_resolve = None
+
+
+def _get_resolve():
+    """
+    Connect to DaVinci Resolve, reusing an existing connection.
+
+    Returns:
+        Resolve object, or None if Resolve is not running
+
+    Raises:
+        ImportError: If the DaVinci Resolve Python API is not available
+    """
+    global _resolve
+
+    if _resolve is None:
+        import DaVinciResolveScript as dvr
+        _resolve = dvr.scriptapp("Resolve")
+
+    return _resolve
+
+
+def main(argv: Optional[List[str]] = None):
+    """
+    Main entry point.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:]), allowing
+              in-process reuse, e.g. main(["--lut", "film.cube", "--all"])
+    """
+    global _lut_refreshed
+
+    parser = _PARSER
+    args = parser.parse_args(argv)
+    _lut_refreshed = False
+    _track_cache.clear()
+    _color_cache.clear()
 
     # Validate that at least one operation is specified
     if not any([args.drx, args.lut, args.cdl_slope, args.cdl_offset,
                 args.cdl_power, args.cdl_saturation]):
         parser.error("At least one grading operation (--drx, --lut, or --cdl-*) is required")
 
+    # Fail fast on bad inputs before connecting to Resolve
+    validate_args(parser, args)
+
     print("=" * 70)
     print("DaVinci Resolve Batch Grade Application")
     print("=" * 70)
@@ -309,8 +591,7 @@ Examples:
 
     # Connect to DaVinci Resolve
     try:
-        import DaVinciResolveScript as dvr
-        resolve = dvr.scriptapp("Resolve")
+        resolve = _get_resolve()
 
         if not resolve:
             print("❌ Could not connect to DaVinci Resolve")
@@ -341,66 +622,80 @@ Examples:
         print("   Check RESOLVE_SCRIPT_API environment variable")
         sys.exit(1)
 
-    # Get target clips
-    print("Selecting target clips...")
+    # Build the operation list once, in application order
+    print("Operations:")
+    ops = []
+
+    if args.drx:
+        print(f"  DRX template: {args.drx}")
+        ops.append(DRXOp(args.drx))
+
+    if args.lut:
+        print(f"  LUT: {args.lut} (Node {args.node})")
+        # Refresh LUT list so newly installed LUTs are found
+        if not args.dry_run:
+            refresh_lut_list(project)
+        ops.append(LUTOp(args.lut, args.node))
 
+    if any([args.cdl_slope, args.cdl_offset, args.cdl_power, args.cdl_saturation]):
+        print(f"  CDL (Node {args.node})")
+        cdl_map = build_cdl_map(
+            args.node,
+            args.cdl_slope,
+            args.cdl_offset,
+            args.cdl_power,
+            args.cdl_saturation
+        )
+        if cdl_map:
+            ops.append(CDLOp(cdl_map))
+        else:
+            print("⚠️  No CDL values specified")
+
+    print()
+
+    if args.dry_run:
+        print("🔍 DRY RUN MODE - No changes will be made")
+        print()
+
+    # Get target clips (--all streams clips track by track)
     if args.all:
-        clips = get_all_video_clips(timeline)
-        print(f"  Target: All video clips ({len(clips)} clips)")
+        clips = iter_all_video_clips(timeline)
+        print("Target: All video clips")
     elif args.track:
         clips = get_clips_by_track(timeline, "video", args.track)
-        print(f"  Target: Video track {args.track} ({len(clips)} clips)")
+        print(f"Target: Video track {args.track} ({len(clips)} clips)")
     elif args.color:
         clips = get_clips_by_color(timeline, args.color)
-        print(f"  Target: Clips with {args.color} color ({len(clips)} clips)")
-
-    if not clips:
-        print("❌ No clips found matching criteria")
-        sys.exit(1)
+        print(f"Target: Clips with {', '.join(sorted(args.color))} color ({len(clips)} clips)")
 
     print()
+    success_counts, clip_count = apply_ops_to_clips(
+        clips, ops,
+        verbose=args.verbose,
+        jobs=max(1, args.jobs),
+        dry_run=args.dry_run
+    )
 
-    # Apply operations
-    operations_applied = 0
+    if clip_count == 0:
+        print("❌ No clips found matching criteria")
+        sys.exit(1)
 
-    # Apply DRX
-    if args.drx:
-        print(f"Applying DRX template: {args.drx}")
-        # Refresh LUT list if we're also applying a LUT
-        if args.lut:
-            project.RefreshLUTList()
-        success = apply_drx_to_clips(clips, args.drx)
-        print(f"  Result: {success}/{len(clips)} clips")
+    if args.verbose:
         print()
-        operations_applied += 1
 
-    # Apply LUT
-    if args.lut:
-        print(f"Applying LUT: {args.lut} (Node {args.node})")
-        # Refresh LUT list
-        project.RefreshLUTList()
-        success = apply_lut_to_clips(clips, args.lut, args.node)
-        print(f"  Result: {success}/{len(clips)} clips")
+    # A dry run has no results; the summary below gives the totals
+    if not args.dry_run:
+        for kind, success in success_counts.items():
+            print(f"  {kind.upper()} result: {success}/{clip_count} clips")
         print()
-        operations_applied += 1
 
-    # Apply CDL
-    if any([args.cdl_slope, args.cdl_offset, args.cdl_power, args.cdl_saturation]):
-        print(f"Applying CDL (Node {args.node})")
-        success = apply_cdl_to_clips(
-            clips,
-            args.node,
-            args.cdl_slope,
-            args.cdl_offset,
-            args.cdl_power,
-            args.cdl_saturation
-        )
-        print(f"  Result: {success}/{len(clips)} clips")
-        print()
-        operations_applied += 1
+    operations_applied = len(ops)
 
     print("=" * 70)
-    print(f"✅ Batch processing complete ({operations_applied} operation(s) applied)")
+    if args.dry_run:
+        print(f"Would apply {operations_applied} operation(s) to {clip_count} clip(s)")
+    else:
+        print(f"✅ Batch processing complete ({operations_applied} operation(s) applied)")
     print("=" * 70)
 
 
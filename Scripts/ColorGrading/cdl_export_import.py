@@ -31,8 +31,11 @@ License: MIT
 import sys
 import os
 import argparse
+import functools
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 import xml.etree.ElementTree as ET
-from xml.dom import minidom
+from xml.sax.saxutils import escape as xml_escape, quoteattr
 from typing import List, Dict, Optional, Any
 from datetime import datetime
 
@@ -41,31 +44,25 @@ api_path = os.environ.get('RESOLVE_SCRIPT_API')
 if api_path:
     sys.path.append(os.path.join(api_path, "Modules"))
 
+from _resolve_clips import get_target_clips
 
-def get_target_clips(
-    timeline,
-    target_all: bool = False,
-    target_track: Optional[int] = None,
-    target_color: Optional[str] = None
-) -> List[Any]:
-    """Get target clips based on criteria."""
-    clips = []
-    video_track_count = timeline.GetTrackCount('video')
+# lxml is optional; when present it parses CDL files without resolving
+# entities and drops indentation whitespace while parsing
+try:
+    from lxml import etree as lxml_etree
+except ImportError:
+    lxml_etree = None
 
-    for track_index in range(1, video_track_count + 1):
-        if target_track and track_index != target_track:
-            continue
+# Per-clip report lines are written in batches of this size
+OUTPUT_FLUSH_LINES = 100
 
-        items = timeline.GetItemListInTrack('video', track_index)
-        if items:
-            for item in items:
-                if target_color:
-                    clip_color = item.GetClipColor()
-                    if not clip_color or clip_color.lower() != target_color.lower():
-                        continue
-                clips.append(item)
 
-    return clips
+def _write_lines(lines: List[str]) -> None:
+    """Write buffered report lines to stdout in one call and clear the buffer."""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+        lines.clear()
 
 
 def get_cdl_from_clip(clip, node_index: int = 1) -> Optional[Dict[str, Any]]:
@@ -91,7 +88,8 @@ def get_cdl_from_clip(clip, node_index: int = 1) -> Optional[Dict[str, Any]]:
                 'power': [1.0, 1.0, 1.0, 1.0],
                 'saturation': 1.0
             }
-    except:
+    except (AttributeError, TypeError, RuntimeError):
+        # Resolve builds without GetNodeColorData, or a bridge failure
         return None
 
 
@@ -109,11 +107,51 @@ def set_cdl_to_clip(clip, cdl: Dict[str, Any], node_index: int = 1) -> bool:
     """
     try:
         return clip.SetNodeColorData(node_index, cdl)
-    except:
+    except (AttributeError, TypeError, RuntimeError):
         return False
 
 
-def export_cdl_xml(clips: List[Any], output_path: str, timeline_name: str = "Timeline") -> bool:
+# Document header for exported CDL files
+CDL_XML_HEADER = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<ColorDecisionList xmlns="urn:ASC:CDL:v1.2">\n'
+    '  <Description>Exported from DaVinci Resolve - {timeline_name}</Description>\n'
+    '  <InputDescription>Created: {created}</InputDescription>\n'
+    '  <ViewingDescription>DaVinci Resolve Color Grading</ViewingDescription>\n'
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _fmt6(value: float) -> str:
+    """Format a CDL value with 6 decimals, cached for repeated values."""
+    return f"{value:.6f}"
+
+
+def is_default_cdl(cdl: Dict[str, Any]) -> bool:
+    """
+    Check whether a CDL is the neutral (ungraded) correction.
+
+    Args:
+        cdl: CDL dictionary
+
+    Returns:
+        True if slope/power are 1.0, offset is 0.0 and saturation is 1.0
+    """
+    return (
+        all(float(v) == 1.0 for v in cdl['slope'][:3])
+        and all(float(v) == 0.0 for v in cdl['offset'][:3])
+        and all(float(v) == 1.0 for v in cdl['power'][:3])
+        and float(cdl['saturation']) == 1.0
+    )
+
+
+def export_cdl_xml(
+    clips: List[Any],
+    output_path: str,
+    timeline_name: str = "Timeline",
+    include_defaults: bool = False,
+    skipped_out: Optional[Dict[str, int]] = None
+) -> Optional[int]:
     """
     Export CDL data to ASC CDL XML file.
 
@@ -121,69 +159,248 @@ def export_cdl_xml(clips: List[Any], output_path: str, timeline_name: str = "Tim
         clips: List of clips
         output_path: Output file path
         timeline_name: Timeline name for metadata
+        include_defaults: If True, also write clips whose CDL is neutral
+        skipped_out: If given, filled with the number of clips skipped
+            because their CDL could not be read ('unreadable') and
+            because it was neutral ('default')
 
     Returns:
-        True if successful
+        Number of ColorCorrections written, or None on failure
     """
     try:
-        # Create root element
-        root = ET.Element('ColorDecisionList', {
-            'xmlns': 'urn:ASC:CDL:v1.2'
-        })
+        # Read all clip data from Resolve first so the XML build is pure CPU
+        clip_cdls = [(clip.GetName(), get_cdl_from_clip(clip)) for clip in clips]
+
+        header = CDL_XML_HEADER.format(
+            timeline_name=xml_escape(timeline_name),
+            created=datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        )
+
+        # Stream the document into a temporary file next to the output and
+        # move it into place only when complete, so a failed export never
+        # leaves a truncated file behind
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(os.path.abspath(output_path)),
+            prefix='.cdl-export-',
+            suffix='.tmp'
+        )
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8', buffering=1 << 16) as f:
+                f.write(header)
+
+                written = 0
+                unreadable = 0
+                defaults = 0
+
+                for clip_name, cdl in clip_cdls:
+                    if not cdl:
+                        unreadable += 1
+                        continue
 
-        # Add metadata
-        description = ET.SubElement(root, 'Description')
-        description.text = f'Exported from DaVinci Resolve - {timeline_name}'
+                    # Ungraded clips carry no information for the receiving app
+                    if not include_defaults and is_default_cdl(cdl):
+                        defaults += 1
+                        continue
 
-        input_desc = ET.SubElement(root, 'InputDescription')
-        input_desc.text = f'Created: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}'
+                    slope, offset, power = cdl['slope'], cdl['offset'], cdl['power']
 
-        viewer_desc = ET.SubElement(root, 'ViewingDescription')
-        viewer_desc.text = 'DaVinci Resolve Color Grading'
+                    f.write(
+                        f'  <ColorCorrection id={quoteattr(clip_name)}>\n'
+                        f'    <SOPNode>\n'
+                        f'      <Slope>{_fmt6(slope[0])} {_fmt6(slope[1])} {_fmt6(slope[2])}</Slope>\n'
+                        f'      <Offset>{_fmt6(offset[0])} {_fmt6(offset[1])} {_fmt6(offset[2])}</Offset>\n'
+                        f'      <Power>{_fmt6(power[0])} {_fmt6(power[1])} {_fmt6(power[2])}</Power>\n'
+                        f'    </SOPNode>\n'
+                        f'    <SatNode>\n'
+                        f'      <Saturation>{_fmt6(cdl["saturation"])}</Saturation>\n'
+                        f'    </SatNode>\n'
+                        f'  </ColorCorrection>\n'
+                    )
 
-        # Add ColorCorrections
-        for clip in clips:
-            clip_name = clip.GetName()
-            cdl = get_cdl_from_clip(clip)
+                    written += 1
 
-            if not cdl:
-                continue
+                f.write('</ColorDecisionList>\n')
 
-            # Create ColorCorrection element
-            cc = ET.SubElement(root, 'ColorCorrection', {'id': clip_name})
+            # mkstemp() creates the file as 0600; use the usual mode instead
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(tmp_path, 0o666 & ~umask)
 
-            # Add SOPNode (Slope, Offset, Power)
-            sop_node = ET.SubElement(cc, 'SOPNode')
+            os.replace(tmp_path, output_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
 
-            slope = ET.SubElement(sop_node, 'Slope')
-            slope.text = f"{cdl['slope'][0]:.6f} {cdl['slope'][1]:.6f} {cdl['slope'][2]:.6f}"
+        if skipped_out is not None:
+            skipped_out['unreadable'] = unreadable
+            skipped_out['default'] = defaults
 
-            offset = ET.SubElement(sop_node, 'Offset')
-            offset.text = f"{cdl['offset'][0]:.6f} {cdl['offset'][1]:.6f} {cdl['offset'][2]:.6f}"
+        return written
 
-            power = ET.SubElement(sop_node, 'Power')
-            power.text = f"{cdl['power'][0]:.6f} {cdl['power'][1]:.6f} {cdl['power'][2]:.6f}"
+    except Exception as e:
+        print(f"Error exporting CDL: {e}")
+        return None
 
-            # Add SatNode
-            sat_node = ET.SubElement(cc, 'SatNode')
-            saturation = ET.SubElement(sat_node, 'Saturation')
-            saturation.text = f"{cdl['saturation']:.6f}"
 
-        # Pretty print XML
-        xml_string = minidom.parseString(ET.tostring(root)).toprettyxml(indent='  ')
+def _local_name(tag: str) -> str:
+    """Strip any '{namespace}' prefix from an element tag."""
+    return tag.rpartition('}')[2]
 
-        # Write to file
-        with open(output_path, 'w') as f:
-            f.write(xml_string)
 
-        return True
+def _parse_rgb(elem, default: float) -> List[float]:
+    """
+    Parse an "R G B" element into a 4-value list with the alpha channel.
 
-    except Exception as e:
-        print(f"Error exporting CDL: {e}")
-        return False
+    Args:
+        elem: Slope/Offset/Power element, or None if absent
+        default: Value used for every channel when the element is absent
+
+    Returns:
+        [R, G, B, alpha] (alpha is the channel default for RGB operations)
+    """
+    if elem is None:
+        return [default, default, default, default]
+    values = list(map(float, elem.text.split()))
+    values.append(default)
+    return values
+
+
+def _iterparse_cdl(input_path: str):
+    """
+    Iterate over end events of a CDL file with entity resolution disabled.
 
+    Uses lxml when available, otherwise the stdlib parser (which does not
+    fetch external entities).
+    """
+    if lxml_etree is not None:
+        return lxml_etree.iterparse(
+            input_path,
+            events=('end',),
+            resolve_entities=False,
+            no_network=True,
+            remove_blank_text=True,
+            collect_ids=False
+        )
+    return ET.iterparse(input_path, events=('end',))
+
+
+def load_cdl_file(input_path: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Load ColorCorrections from an ASC CDL XML file.
 
-def import_cdl_xml(clips: List[Any], input_path: str, dry_run: bool = False) -> int:
+    The file is streamed with iterparse and each ColorCorrection is cleared
+    once read, so memory use does not grow with file size. Namespaced
+    (urn:ASC:CDL:v1.2) and bare documents are handled by the same path.
+
+    Args:
+        input_path: Input CDL file path
+
+    Returns:
+        Dictionary of CDL values keyed by ColorCorrection id
+    """
+    cdl_data = {}
+
+    for _, cc in _iterparse_cdl(input_path):
+        # Comments and processing instructions have non-string tags in lxml
+        if not isinstance(cc.tag, str) or _local_name(cc.tag) != 'ColorCorrection':
+            continue
+
+        clip_id = cc.get('id')
+
+        # Index the correction's elements by local name in one sweep
+        elems = {_local_name(e.tag): e for e in cc.iter() if isinstance(e.tag, str)}
+
+        # Get SOP values
+        if 'SOPNode' in elems:
+            slope = _parse_rgb(elems.get('Slope'), 1.0)
+            offset = _parse_rgb(elems.get('Offset'), 0.0)
+            power = _parse_rgb(elems.get('Power'), 1.0)
+        else:
+            slope = [1.0, 1.0, 1.0, 1.0]
+            offset = [0.0, 0.0, 0.0, 0.0]
+            power = [1.0, 1.0, 1.0, 1.0]
+
+        # Get Saturation
+        sat_elem = elems.get('Saturation')
+        saturation = float(sat_elem.text) if sat_elem is not None else 1.0
+
+        cdl_data[clip_id] = {
+            'slope': slope,
+            'offset': offset,
+            'power': power,
+            'saturation': saturation
+        }
+
+        # Release the parsed subtree
+        cc.clear()
+
+    return cdl_data
+
+
+# Substring matching is O(clips x corrections); skip it for large CDL files
+PARTIAL_MATCH_LIMIT = 64
+
+
+def build_cdl_index(cdl_data: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Build a case-insensitive lookup of CDL ids and their extensionless stems.
+
+    Args:
+        cdl_data: CDL values keyed by ColorCorrection id
+
+    Returns:
+        CDL values keyed by lowercased id and lowercased id stem
+    """
+    index = {}
+
+    for cdl_id, cdl_values in cdl_data.items():
+        if not cdl_id:
+            continue
+        lower_id = cdl_id.lower()
+        index.setdefault(os.path.splitext(lower_id)[0], cdl_values)
+        index[lower_id] = cdl_values
+
+    return index
+
+
+def match_cdl(
+    clip_name: str,
+    cdl_data: Dict[str, Dict[str, Any]],
+    cdl_index: Dict[str, Dict[str, Any]]
+) -> Optional[Dict[str, Any]]:
+    """
+    Find the CDL for a clip by name.
+
+    Tries an exact match, then a case-insensitive match on the name and its
+    stem (e.g. "A001.mov" matches id "A001"), and finally a substring match
+    when the CDL file is small enough for a linear scan.
+
+    Args:
+        clip_name: Clip name
+        cdl_data: CDL values keyed by ColorCorrection id
+        cdl_index: Lookup built by build_cdl_index()
+
+    Returns:
+        CDL dictionary or None
+    """
+    cdl = cdl_data.get(clip_name)
+    if cdl:
+        return cdl
+
+    name_lower = clip_name.lower()
+    cdl = cdl_index.get(name_lower) or cdl_index.get(os.path.splitext(name_lower)[0])
+    if cdl:
+        return cdl
+
+    if len(cdl_data) <= PARTIAL_MATCH_LIMIT:
+        for cdl_id, cdl_values in cdl_data.items():
+            if cdl_id and (cdl_id in clip_name or clip_name in cdl_id):
+                return cdl_values
+
+    return None
+
+
+def import_cdl_xml(clips: List[Any], input_path: str, dry_run: bool = False, jobs: int = 1) -> int:
     """
     Import CDL data from ASC CDL XML file.
 
@@ -191,95 +408,13 @@ def import_cdl_xml(clips: List[Any], input_path: str, dry_run: bool = False) ->
         clips: List of clips to apply CDL to
         input_path: Input CDL file path
         dry_run: If True, don't actually apply
+        jobs: Number of clips to update concurrently (1 = sequential)
 
     Returns:
         Number of clips updated
     """
     try:
-        # Parse XML
-        tree = ET.parse(input_path)
-        root = tree.getroot()
-
-        # Handle namespace
-        ns = {'cdl': 'urn:ASC:CDL:v1.2'}
-
-        # Extract ColorCorrections
-        cdl_data = {}
-
-        for cc in root.findall('.//cdl:ColorCorrection', ns):
-            clip_id = cc.get('id')
-
-            # Get SOP values
-            sop_node = cc.find('cdl:SOPNode', ns)
-            if sop_node is not None:
-                slope_elem = sop_node.find('cdl:Slope', ns)
-                offset_elem = sop_node.find('cdl:Offset', ns)
-                power_elem = sop_node.find('cdl:Power', ns)
-
-                slope = [float(x) for x in slope_elem.text.split()] if slope_elem is not None else [1.0, 1.0, 1.0]
-                offset = [float(x) for x in offset_elem.text.split()] if offset_elem is not None else [0.0, 0.0, 0.0]
-                power = [float(x) for x in power_elem.text.split()] if power_elem is not None else [1.0, 1.0, 1.0]
-
-                # Add alpha channel (always 1.0 for RGB operations)
-                slope.append(1.0)
-                offset.append(0.0)
-                power.append(1.0)
-            else:
-                slope = [1.0, 1.0, 1.0, 1.0]
-                offset = [0.0, 0.0, 0.0, 0.0]
-                power = [1.0, 1.0, 1.0, 1.0]
-
-            # Get Saturation
-            sat_node = cc.find('cdl:SatNode', ns)
-            if sat_node is not None:
-                sat_elem = sat_node.find('cdl:Saturation', ns)
-                saturation = float(sat_elem.text) if sat_elem is not None else 1.0
-            else:
-                saturation = 1.0
-
-            cdl_data[clip_id] = {
-                'slope': slope,
-                'offset': offset,
-                'power': power,
-                'saturation': saturation
-            }
-
-        # Also try without namespace (for compatibility)
-        if not cdl_data:
-            for cc in root.findall('.//ColorCorrection'):
-                clip_id = cc.get('id')
-
-                sop_node = cc.find('SOPNode')
-                if sop_node is not None:
-                    slope_elem = sop_node.find('Slope')
-                    offset_elem = sop_node.find('Offset')
-                    power_elem = sop_node.find('Power')
-
-                    slope = [float(x) for x in slope_elem.text.split()] if slope_elem is not None else [1.0, 1.0, 1.0]
-                    offset = [float(x) for x in offset_elem.text.split()] if offset_elem is not None else [0.0, 0.0, 0.0]
-                    power = [float(x) for x in power_elem.text.split()] if power_elem is not None else [1.0, 1.0, 1.0]
-
-                    slope.append(1.0)
-                    offset.append(0.0)
-                    power.append(1.0)
-                else:
-                    slope = [1.0, 1.0, 1.0, 1.0]
-                    offset = [0.0, 0.0, 0.0, 0.0]
-                    power = [1.0, 1.0, 1.0, 1.0]
-
-                sat_node = cc.find('SatNode')
-                if sat_node is not None:
-                    sat_elem = sat_node.find('Saturation')
-                    saturation = float(sat_elem.text) if sat_elem is not None else 1.0
-                else:
-                    saturation = 1.0
-
-                cdl_data[clip_id] = {
-                    'slope': slope,
-                    'offset': offset,
-                    'power': power,
-                    'saturation': saturation
-                }
+        cdl_data = load_cdl_file(input_path)
 
         if not cdl_data:
             print("No CDL data found in file")
@@ -288,35 +423,47 @@ def import_cdl_xml(clips: List[Any], input_path: str, dry_run: bool = False) ->
         print(f"Loaded {len(cdl_data)} CDL correction(s) from file")
         print()
 
-        # Apply to clips
-        applied = 0
+        # Match clips to corrections
+        cdl_index = build_cdl_index(cdl_data)
+        matches = []
 
         for clip in clips:
             clip_name = clip.GetName()
+            matches.append((clip, clip_name, match_cdl(clip_name, cdl_data, cdl_index)))
 
-            # Try to find matching CDL by clip name
-            cdl = cdl_data.get(clip_name)
+        # Apply matched corrections (concurrently when jobs > 1)
+        to_apply = [(clip, cdl) for clip, _, cdl in matches if cdl]
 
-            if not cdl:
-                # Try partial match
-                for cdl_id, cdl_values in cdl_data.items():
-                    if cdl_id in clip_name or clip_name in cdl_id:
-                        cdl = cdl_values
-                        break
+        if dry_run:
+            results = [True] * len(to_apply)
+        elif jobs > 1:
+            with ThreadPoolExecutor(max_workers=jobs) as executor:
+                results = list(executor.map(lambda pair: set_cdl_to_clip(*pair), to_apply))
+        else:
+            results = [set_cdl_to_clip(clip, cdl) for clip, cdl in to_apply]
+
+        applied = 0
+        result_iter = iter(results)
+        lines = []
 
+        for clip, clip_name, cdl in matches:
             if cdl:
+                success = next(result_iter)
                 if dry_run:
-                    print(f"  Would apply CDL to: {clip_name}")
+                    lines.append(f"  Would apply CDL to: {clip_name}")
+                    applied += 1
+                elif success:
+                    lines.append(f"  ✅ Applied CDL to: {clip_name}")
                     applied += 1
                 else:
-                    success = set_cdl_to_clip(clip, cdl)
-                    if success:
-                        print(f"  ✅ Applied CDL to: {clip_name}")
-                        applied += 1
-                    else:
-                        print(f"  ❌ Failed to apply: {clip_name}")
+                    lines.append(f"  ❌ Failed to apply: {clip_name}")
             else:
-                print(f"  ⚠️  No matching CDL for: {clip_name}")
+                lines.append(f"  ⚠️  No matching CDL for: {clip_name}")
+
+            if len(lines) >= OUTPUT_FLUSH_LINES:
+                _write_lines(lines)
+
+        _write_lines(lines)
 
         return applied
 
@@ -335,21 +482,28 @@ def show_cdl_info(clips: List[Any]) -> None:
     print("CDL Information:")
     print()
 
+    lines = []
+
     for clip in clips:
         clip_name = clip.GetName()
         cdl = get_cdl_from_clip(clip)
 
-        print(f"📹 {clip_name}")
+        lines.append(f"📹 {clip_name}")
 
         if cdl:
-            print(f"   Slope:  [{cdl['slope'][0]:.3f}, {cdl['slope'][1]:.3f}, {cdl['slope'][2]:.3f}]")
-            print(f"   Offset: [{cdl['offset'][0]:.3f}, {cdl['offset'][1]:.3f}, {cdl['offset'][2]:.3f}]")
-            print(f"   Power:  [{cdl['power'][0]:.3f}, {cdl['power'][1]:.3f}, {cdl['power'][2]:.3f}]")
-            print(f"   Saturation: {cdl['saturation']:.3f}")
+            lines.append(f"   Slope:  [{cdl['slope'][0]:.3f}, {cdl['slope'][1]:.3f}, {cdl['slope'][2]:.3f}]")
+            lines.append(f"   Offset: [{cdl['offset'][0]:.3f}, {cdl['offset'][1]:.3f}, {cdl['offset'][2]:.3f}]")
+            lines.append(f"   Power:  [{cdl['power'][0]:.3f}, {cdl['power'][1]:.3f}, {cdl['power'][2]:.3f}]")
+            lines.append(f"   Saturation: {cdl['saturation']:.3f}")
         else:
-            print("   No CDL data")
+            lines.append("   No CDL data")
 
-        print()
+        lines.append("")
+
+        if len(lines) >= OUTPUT_FLUSH_LINES:
+            _write_lines(lines)
+
+    _write_lines(lines)
 
 
 def main():
@@ -365,6 +519,9 @@ Examples:
   # Export from specific track
   %(prog)s --export track1.cdl --track 1
 
+  # Export including ungraded clips
+  %(prog)s --export all.cdl --all --include-defaults
+
   # Import CDL to all clips
   %(prog)s --import input.cdl --all
 
@@ -436,6 +593,20 @@ CDL Format:
         help='Show what would be done without applying (import only)'
     )
 
+    parser.add_argument(
+        '--include-defaults',
+        action='store_true',
+        help='Export clips with a neutral (default) CDL too (export only)'
+    )
+
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=1,
+        metavar='N',
+        help='Number of clips to update concurrently (import only, default: 1)'
+    )
+
     args = parser.parse_args()
 
     print("=" * 70)
@@ -506,14 +677,25 @@ CDL Format:
         print(f"Exporting CDL to: {args.export}")
         print()
 
-        success = export_cdl_xml(target_clips, args.export, timeline_name)
+        skipped = {}
+        written = export_cdl_xml(
+            target_clips,
+            args.export,
+            timeline_name,
+            include_defaults=args.include_defaults,
+            skipped_out=skipped
+        )
 
         print()
         print("=" * 70)
 
-        if success:
+        if written is not None:
             print(f"✅ Successfully exported CDL to: {args.export}")
-            print(f"   {len(target_clips)} clip(s) included")
+            print(f"   {written} clip(s) included")
+            if skipped['default']:
+                print(f"   {skipped['default']} clip(s) skipped (no grade; use --include-defaults to keep)")
+            if skipped['unreadable']:
+                print(f"   ⚠️  {skipped['unreadable']} clip(s) skipped (CDL could not be read)")
         else:
             print("❌ Export failed")
 
@@ -525,7 +707,12 @@ CDL Format:
             print(f"❌ File not found: {args.import_file}")
             sys.exit(1)
 
-        applied = import_cdl_xml(target_clips, args.import_file, dry_run=args.dry_run)
+        applied = import_cdl_xml(
+            target_clips,
+            args.import_file,
+            dry_run=args.dry_run,
+            jobs=max(1, args.jobs)
+        )
 
         print()
         print("=" * 70)
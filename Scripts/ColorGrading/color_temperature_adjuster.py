@@ -28,13 +28,16 @@ License: MIT
 import sys
 import os
 import argparse
-from typing import List, Dict, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Any, Tuple
 
 # Add DaVinci Resolve API to path
 api_path = os.environ.get('RESOLVE_SCRIPT_API')
 if api_path:
     sys.path.append(os.path.join(api_path, "Modules"))
 
+from _resolve_clips import get_target_clips
+
 
 # Color temperature presets (in Kelvin)
 TEMPERATURE_PRESETS = {
@@ -76,47 +79,97 @@ TEMPERATURE_PRESETS = {
 }
 
 
-def get_target_clips(
-    timeline,
-    target_all: bool = False,
-    target_track: Optional[int] = None,
-    target_color: Optional[str] = None
-) -> List[Any]:
+# Per-clip report lines are written in batches of this size
+OUTPUT_FLUSH_LINES = 100
+
+
+def _write_lines(lines: List[str]) -> None:
+    """Write buffered report lines to stdout in one call and clear the buffer."""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+        lines.clear()
+
+
+# Neutral CDL used when a node has no color data yet
+DEFAULT_CDL = {
+    'slope': (1.0, 1.0, 1.0, 1.0),
+    'offset': (0.0, 0.0, 0.0, 0.0),
+    'power': (1.0, 1.0, 1.0, 1.0),
+    'saturation': 1.0
+}
+
+
+def temperature_to_rb_shift(temperature: float) -> Tuple[float, float]:
     """
-    Get target clips based on criteria.
+    Convert a color temperature to red/blue slope values.
+
+    Pure float arithmetic with no Resolve calls, so it can be reused (or
+    JIT-compiled) for per-clip temperatures computed from frame analysis.
 
     Args:
-        timeline: Timeline object
-        target_all: Target all clips
-        target_track: Target specific track
-        target_color: Target clips with specific color
+        temperature: Color temperature in Kelvin
 
     Returns:
-        List of TimelineItem objects
+        (red, blue) slope values
     """
-    clips = []
-    video_track_count = timeline.GetTrackCount('video')
+    # Warmer = more red/yellow, Cooler = more blue
+    if temperature < 5000:
+        # Warm (tungsten)
+        shift = (5600 - temperature) / 10000
+        return 1.0 + shift, 1.0 - shift
 
-    for track_index in range(1, video_track_count + 1):
-        if target_track and track_index != target_track:
-            continue
+    # Cool (daylight+)
+    shift = (temperature - 5600) / 10000
+    return 1.0 - shift, 1.0 + shift
 
-        items = timeline.GetItemListInTrack('video', track_index)
-        if items:
-            for item in items:
-                if target_color:
-                    clip_color = item.GetClipColor()
-                    if not clip_color or clip_color.lower() != target_color.lower():
-                        continue
-                clips.append(item)
 
-    return clips
+def tint_to_g_shift(tint: float) -> float:
+    """
+    Convert a tint value to a green slope value.
+
+    Args:
+        tint: Tint value (-50 to +50, positive = green, negative = magenta)
+
+    Returns:
+        Green slope value
+    """
+    return 1.0 + (tint / 100.0)
+
+
+def temperature_to_slope(
+    temperature: Optional[float] = None,
+    tint: Optional[float] = None
+) -> Tuple[Optional[float], Optional[float], Optional[float]]:
+    """
+    Convert temperature and tint to RGB slope values.
+
+    This is an approximation - actual implementation may vary.
+
+    Args:
+        temperature: Color temperature in Kelvin
+        tint: Tint value (-50 to +50)
+
+    Returns:
+        (red, green, blue) slope values; None for channels left unchanged
+    """
+    r_shift = g_shift = b_shift = None
+
+    if temperature is not None:
+        r_shift, b_shift = temperature_to_rb_shift(float(temperature))
+
+    if tint is not None:
+        g_shift = tint_to_g_shift(float(tint))
+
+    return r_shift, g_shift, b_shift
 
 
 def set_color_temperature(
     clip,
     temperature: Optional[float] = None,
-    tint: Optional[float] = None
+    tint: Optional[float] = None,
+    slope_shift: Optional[Tuple[Optional[float], Optional[float], Optional[float]]] = None,
+    reset_cdl: bool = False
 ) -> bool:
     """
     Set color temperature and tint for a clip.
@@ -125,6 +178,10 @@ def set_color_temperature(
         clip: TimelineItem object
         temperature: Color temperature in Kelvin
         tint: Tint value (-50 to +50)
+        slope_shift: Precomputed temperature_to_slope(temperature, tint),
+                     to avoid recomputing it for every clip in a batch
+        reset_cdl: If True, start from a neutral CDL instead of reading the
+                   node's current values (discards existing CDL grading)
 
     Returns:
         True if successful
@@ -143,38 +200,30 @@ def set_color_temperature(
         node_index = 1
 
         # Create CDL adjustment based on temperature
-        # This is an approximation - actual implementation may vary
         if temperature is not None:
-            # Convert temperature to RGB shift
-            # Warmer = more red/yellow, Cooler = more blue
-            if temperature < 5000:
-                # Warm (tungsten)
-                r_shift = 1.0 + ((5600 - temperature) / 10000)
-                b_shift = 1.0 - ((5600 - temperature) / 10000)
-            else:
-                # Cool (daylight+)
-                r_shift = 1.0 - ((temperature - 5600) / 10000)
-                b_shift = 1.0 + ((temperature - 5600) / 10000)
-
-            # Get current CDL
-            cdl = clip.GetNodeColorData(node_index)
+            if slope_shift is None:
+                slope_shift = temperature_to_slope(temperature, tint)
+            r_shift, g_shift, b_shift = slope_shift
+
+            # Get current CDL (skipped when resetting to neutral)
+            cdl = None if reset_cdl else clip.GetNodeColorData(node_index)
             if not cdl:
+                # Fresh lists per call: the API expects lists, and the
+                # shared tuples must not end up in a clip's CDL
                 cdl = {
-                    'slope': [1.0, 1.0, 1.0, 1.0],
-                    'offset': [0.0, 0.0, 0.0, 0.0],
-                    'power': [1.0, 1.0, 1.0, 1.0],
-                    'saturation': 1.0
+                    'slope': list(DEFAULT_CDL['slope']),
+                    'offset': list(DEFAULT_CDL['offset']),
+                    'power': list(DEFAULT_CDL['power']),
+                    'saturation': DEFAULT_CDL['saturation']
                 }
 
-            # Adjust slope for temperature
-            cdl['slope'][0] = r_shift  # Red
-            cdl['slope'][2] = b_shift  # Blue
-
-            # Apply tint if specified (green/magenta shift)
-            if tint is not None:
-                # Positive tint = green, Negative = magenta
-                g_shift = 1.0 + (tint / 100.0)
-                cdl['slope'][1] = g_shift  # Green
+            # Adjust slope for temperature (and tint: green/magenta shift)
+            slope = list(cdl['slope'])
+            slope[0] = r_shift  # Red
+            slope[2] = b_shift  # Blue
+            if g_shift is not None:
+                slope[1] = g_shift  # Green
+            cdl['slope'] = slope
 
             # Set CDL
             success = clip.SetNodeColorData(node_index, cdl)
@@ -191,7 +240,9 @@ def apply_temperature_adjustment(
     clips: List[Any],
     temperature: Optional[float] = None,
     tint: Optional[float] = None,
-    dry_run: bool = False
+    dry_run: bool = False,
+    jobs: int = 1,
+    reset_cdl: bool = False
 ) -> int:
     """
     Apply temperature adjustment to clips.
@@ -201,33 +252,58 @@ def apply_temperature_adjustment(
         temperature: Color temperature in Kelvin
         tint: Tint value
         dry_run: If True, don't actually apply
+        jobs: Number of clips to adjust concurrently (1 = sequential)
+        reset_cdl: If True, overwrite each clip's CDL without reading it first
 
     Returns:
         Number of clips adjusted
     """
     adjusted = 0
 
-    for clip in clips:
+    # Every clip gets the same shift, so compute it once
+    slope_shift = temperature_to_slope(temperature, tint)
+
+    if dry_run:
+        results = [True] * len(clips)
+    elif jobs > 1:
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            results = list(executor.map(
+                lambda clip: set_color_temperature(clip, temperature, tint, slope_shift, reset_cdl),
+                clips
+            ))
+    else:
+        results = [
+            set_color_temperature(clip, temperature, tint, slope_shift, reset_cdl)
+            for clip in clips
+        ]
+
+    # Same detail lines for every adjusted clip
+    details = []
+    if temperature:
+        details.append(f"    Temperature: {temperature}K")
+    if tint:
+        details.append(f"    Tint: {tint:+.1f}")
+
+    lines = []
+
+    for clip, success in zip(clips, results):
         clip_name = clip.GetName()
 
         if dry_run:
-            print(f"  Would adjust: {clip_name}")
-            if temperature:
-                print(f"    Temperature: {temperature}K")
-            if tint:
-                print(f"    Tint: {tint:+.1f}")
+            lines.append(f"  Would adjust: {clip_name}")
+            lines.extend(details)
+            adjusted += 1
+        elif success:
+            lines.append(f"  ✅ Adjusted: {clip_name}")
+            lines.extend(details)
             adjusted += 1
         else:
-            success = set_color_temperature(clip, temperature, tint)
-            if success:
-                print(f"  ✅ Adjusted: {clip_name}")
-                if temperature:
-                    print(f"    Temperature: {temperature}K")
-                if tint:
-                    print(f"    Tint: {tint:+.1f}")
-                adjusted += 1
-            else:
-                print(f"  ❌ Failed: {clip_name}")
+            lines.append(f"  ❌ Failed: {clip_name}")
+
+        if len(lines) >= OUTPUT_FLUSH_LINES:
+            _write_lines(lines)
+
+    _write_lines(lines)
 
     return adjusted
 
@@ -272,6 +348,9 @@ Examples:
   # Dry run
   %(prog)s --preset cloudy --all --dry-run
 
+  # Apply preset to fresh footage, replacing any existing CDL
+  %(prog)s --preset daylight --all --reset-cdl
+
 Available presets: tungsten, sunrise, fluorescent, cloudy, daylight, shade, blue_hour
         """
     )
@@ -337,6 +416,21 @@ Available presets: tungsten, sunrise, fluorescent, cloudy, daylight, shade, blue
         help='Show what would be done without applying'
     )
 
+    parser.add_argument(
+        '--reset-cdl',
+        action='store_true',
+        help='Start from a neutral CDL instead of keeping the current offset/power/saturation '
+             '(discards existing CDL grading on node 1, skips one API read per clip)'
+    )
+
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=1,
+        metavar='N',
+        help='Number of clips to adjust concurrently (default: 1)'
+    )
+
     args = parser.parse_args()
 
     # List presets if requested
@@ -430,7 +524,9 @@ Available presets: tungsten, sunrise, fluorescent, cloudy, daylight, shade, blue
         target_clips,
         temperature=temperature,
         tint=tint,
-        dry_run=args.dry_run
+        dry_run=args.dry_run,
+        jobs=max(1, args.jobs),
+        reset_cdl=args.reset_cdl
     )
 
     # Summary
@@ -15,49 +15,76 @@ License: MIT
 
 import sys
 import os
-import argparse
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
 
 api_path = os.environ.get('RESOLVE_SCRIPT_API')
 if api_path:
     sys.path.append(os.path.join(api_path, "Modules"))
 
+from _resolve_clips import select_clips
+
+OUTPUT_FLUSH_LINES = 100
+
+
+def _write_lines(lines):
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+        lines.clear()
+
+
 CONTRAST_PRESETS = {
-    'flat': {'power': [1.0, 1.0, 1.0, 1.0], 'desc': 'Flat contrast'},
-    'natural': {'power': [0.95, 0.95, 0.95, 1.0], 'desc': 'Natural contrast'},
-    'cinematic': {'power': [0.85, 0.85, 0.85, 1.0], 'desc': 'Cinematic S-curve'},
-    'high': {'power': [0.7, 0.7, 0.7, 1.0], 'desc': 'High contrast'},
+    'flat': {'power': (1.0, 1.0, 1.0, 1.0), 'desc': 'Flat contrast'},
+    'natural': {'power': (0.95, 0.95, 0.95, 1.0), 'desc': 'Natural contrast'},
+    'cinematic': {'power': (0.85, 0.85, 0.85, 1.0), 'desc': 'Cinematic S-curve'},
+    'high': {'power': (0.7, 0.7, 0.7, 1.0), 'desc': 'High contrast'},
 }
 
+_EMPTY_CDL_TEMPLATE = {'slope': [1.0]*4, 'offset': [0.0]*4, 'power': [1.0]*4, 'saturation': 1.0}
+
+
+def _empty_cdl():
+    return {
+        'slope': _EMPTY_CDL_TEMPLATE['slope'][:],
+        'offset': _EMPTY_CDL_TEMPLATE['offset'][:],
+        'power': _EMPTY_CDL_TEMPLATE['power'][:],
+        'saturation': _EMPTY_CDL_TEMPLATE['saturation'],
+    }
+
+
+def iter_clips(timeline, track=None, color=None):
+    # Lazy: each track is fetched only when the caller gets to it
+    tracks = [track] if track else range(1, timeline.GetTrackCount('video') + 1)
+    for i in tracks:
+        yield from select_clips({i: timeline.GetItemListInTrack('video', i) or []}, color=color)
+
 def get_clips(timeline, all_clips=False, track=None, color=None):
-    clips = []
-    for i in range(1, timeline.GetTrackCount('video') + 1):
-        if track and i != track:
-            continue
-        items = timeline.GetItemListInTrack('video', i)
-        if items:
-            for item in items:
-                if color and (not item.GetClipColor() or item.GetClipColor().lower() != color.lower()):
-                    continue
-                clips.append(item)
-    return clips
+    return list(iter_clips(timeline, track, color))
 
 def adjust_contrast(clip, power_values=None, highlights=None, shadows=None):
+    has_highlights = highlights is not None and highlights != 0.0
+    has_shadows = shadows is not None and shadows != 0.0
+    # Nothing to change: skip both the read and the write
+    if power_values is None and not has_highlights and not has_shadows:
+        return True
     try:
-        cdl = clip.GetNodeColorData(1) or {'slope': [1.0]*4, 'offset': [0.0]*4, 'power': [1.0]*4, 'saturation': 1.0}
-        if power_values:
-            cdl['power'] = power_values
-        if highlights:
+        cdl = clip.GetNodeColorData(1) or _empty_cdl()
+        if power_values is not None:
+            cdl['power'] = list(power_values)
+        if has_highlights:
             for i in range(3):
                 cdl['slope'][i] = 1.0 + highlights
-        if shadows:
+        if has_shadows:
             for i in range(3):
                 cdl['offset'][i] = shadows
         return clip.SetNodeColorData(1, cdl)
-    except:
+    except (AttributeError, KeyError, TypeError, RuntimeError):
         return False
 
 def main():
+    import argparse  # only needed for the CLI, not when imported
+
     parser = argparse.ArgumentParser(description="Contrast manager")
     mode = parser.add_mutually_exclusive_group(required=True)
     mode.add_argument('--preset', choices=CONTRAST_PRESETS.keys())
@@ -71,6 +98,8 @@ def main():
     target.add_argument('--track', type=int)
     target.add_argument('--color', type=str)
     parser.add_argument('--dry-run', action='store_true')
+    parser.add_argument('--jobs', type=int, default=1)
+    parser.add_argument('-q', '--quiet', action='store_true')
     args = parser.parse_args()
 
     if args.list_presets:
@@ -88,7 +117,7 @@ def main():
         if not timeline:
             print("❌ No timeline")
             sys.exit(1)
-    except:
+    except (ImportError, AttributeError):
         print("❌ Connection failed")
         sys.exit(1)
 
@@ -98,15 +127,30 @@ def main():
         sys.exit(1)
 
     power = CONTRAST_PRESETS[args.preset]['power'] if args.preset else None
+    apply = lambda clip: adjust_contrast(clip, power, args.highlights, args.shadows)
+    if args.dry_run:
+        results = [True] * len(clips)
+    elif args.jobs > 1:
+        with ThreadPoolExecutor(max_workers=args.jobs) as ex:
+            results = list(ex.map(apply, clips))
+    else:
+        results = [apply(clip) for clip in clips]
+
     adjusted = 0
-    for clip in clips:
+    lines = []
+    for clip, ok in zip(clips, results):
+        if not ok:
+            continue
+        adjusted += 1
+        if args.quiet:
+            continue
         if args.dry_run:
-            print(f"  Would adjust: {clip.GetName()}")
-            adjusted += 1
+            lines.append(f"  Would adjust: {clip.GetName()}")
         else:
-            if adjust_contrast(clip, power, args.highlights, args.shadows):
-                print(f"  ✅ {clip.GetName()}")
-                adjusted += 1
+            lines.append(f"  ✅ {clip.GetName()}")
+        if len(lines) >= OUTPUT_FLUSH_LINES:
+            _write_lines(lines)
+    _write_lines(lines)
     print(f"\n{adjusted} clips adjusted")
 
 if __name__ == "__main__":
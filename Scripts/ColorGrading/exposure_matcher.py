@@ -24,56 +24,90 @@ License: MIT
 
 import sys
 import os
-import argparse
-from typing import List, Dict, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Any, Set, Tuple
 
 # Add DaVinci Resolve API to path
 api_path = os.environ.get('RESOLVE_SCRIPT_API')
 if api_path:
     sys.path.append(os.path.join(api_path, "Modules"))
 
+from _resolve_clips import get_items_by_track, select_clips
+
+# Per-clip report lines are written in batches of this size
+OUTPUT_FLUSH_LINES = 100
+
+
+def _write_lines(lines: List[str]) -> None:
+    """Write buffered report lines to stdout in one call and clear the buffer."""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+        lines.clear()
+
 
 def get_target_clips(
-    timeline,
+    items_by_track: Dict[int, List[Any]],
     target_all: bool = False,
     target_track: Optional[int] = None,
     target_color: Optional[str] = None,
-    exclude_clip=None
+    exclude_ids: Optional[Set[int]] = None,
+    clip_meta: Optional[Dict[int, Dict[str, Any]]] = None
 ) -> List[Any]:
-    """Get target clips based on criteria."""
-    clips = []
-    video_track_count = timeline.GetTrackCount('video')
+    """
+    Get target clips based on criteria.
 
-    for track_index in range(1, video_track_count + 1):
-        if target_track and track_index != target_track:
-            continue
+    Args:
+        items_by_track: Track contents from get_items_by_track() or scan_timeline()
+        target_all: Select clips on every track
+        target_track: Only select clips on this track
+        target_color: Only select clips with this clip color
+        exclude_ids: id() of clips to skip; must be the same objects as
+            the items in items_by_track
+        clip_meta: Cached clip names/colors from scan_timeline()
 
-        items = timeline.GetItemListInTrack('video', track_index)
-        if items:
-            for item in items:
-                if exclude_clip and item == exclude_clip:
-                    continue
+    Returns:
+        List of matching clips in track order
+    """
+    return select_clips(
+        items_by_track,
+        track=target_track,
+        color=target_color,
+        exclude_ids=exclude_ids,
+        clip_meta=clip_meta
+    )
 
-                if target_color:
-                    clip_color = item.GetClipColor()
-                    if not clip_color or clip_color.lower() != target_color.lower():
-                        continue
-                clips.append(item)
 
-    return clips
+def scan_timeline(
+    timeline,
+    with_colors: bool = False
+) -> Tuple[Dict[int, List[Any]], Dict[str, Any], Dict[int, Dict[str, Any]]]:
+    """
+    Walk every video track once.
 
+    Args:
+        timeline: Timeline object
+        with_colors: Also read each clip's color (only needed for --color)
 
-def find_clip_by_name(timeline, clip_name: str) -> Optional[Any]:
-    """Find clip by name in timeline."""
-    video_track_count = timeline.GetTrackCount('video')
+    Returns:
+        (items_by_track, name_to_item, clip_meta). When names repeat, the
+        first clip in track order wins.
+        clip_meta maps id(clip) to its cached 'name' (and 'color').
+    """
+    items_by_track = get_items_by_track(timeline)
+    name_to_item = {}
+    clip_meta = {}
+
+    for track_index in sorted(items_by_track):
+        for item in items_by_track[track_index]:
+            name = item.GetName()
+            meta = {'name': name}
+            if with_colors:
+                meta['color'] = item.GetClipColor()
+            clip_meta[id(item)] = meta
+            name_to_item.setdefault(name, item)
 
-    for track_index in range(1, video_track_count + 1):
-        items = timeline.GetItemListInTrack('video', track_index)
-        if items:
-            for item in items:
-                if item.GetName() == clip_name:
-                    return item
-    return None
+    return items_by_track, name_to_item, clip_meta
 
 
 def adjust_exposure(clip, offset: float) -> bool:
@@ -104,6 +138,13 @@ def adjust_exposure(clip, offset: float) -> bool:
                 'saturation': 1.0
             }
 
+        # A zero offset only resets power/slope; skip the write if they
+        # are already neutral
+        if offset == 0.0 and \
+                list(cdl['power'][:3]) == [1.0, 1.0, 1.0] and \
+                list(cdl['slope'][:3]) == [1.0, 1.0, 1.0]:
+            return True
+
         # Apply exposure offset
         # Positive offset = brighter, negative = darker
         # Adjust all three: offset (shadows), power (midtones), slope (highlights)
@@ -128,15 +169,26 @@ def adjust_exposure(clip, offset: float) -> bool:
         success = clip.SetNodeColorData(node_index, cdl)
         return success
 
-    except Exception as e:
+    except (AttributeError, KeyError, TypeError, RuntimeError) as e:
         print(f"  ⚠️  Error: {e}")
         return False
 
 
+def _run_on_clips(func, clips: List[Any], jobs: int = 1) -> List[bool]:
+    """Call func(clip) for every clip, concurrently if jobs > 1, keeping clip order."""
+    if jobs > 1:
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            return list(executor.map(func, clips))
+    return [func(clip) for clip in clips]
+
+
 def match_to_reference(
     target_clips: List[Any],
     reference_clip: Any,
-    dry_run: bool = False
+    dry_run: bool = False,
+    jobs: int = 1,
+    quiet: bool = False,
+    clip_meta: Optional[Dict[int, Dict[str, Any]]] = None
 ) -> int:
     """
     Match target clips to reference clip exposure.
@@ -145,12 +197,21 @@ def match_to_reference(
         target_clips: List of clips to adjust
         reference_clip: Reference clip
         dry_run: If True, don't actually apply
+        jobs: Number of clips to adjust concurrently (1 = sequential)
+        quiet: If True, only report clips that failed
+        clip_meta: Cached clip names from scan_timeline()
 
     Returns:
         Number of clips matched
     """
     matched = 0
-    ref_name = reference_clip.GetName()
+    clip_meta = clip_meta or {}
+
+    def clip_name_of(clip):
+        meta = clip_meta.get(id(clip))
+        return meta['name'] if meta else clip.GetName()
+
+    ref_name = clip_name_of(reference_clip)
 
     print(f"Reference clip: {ref_name}")
     print()
@@ -161,21 +222,34 @@ def match_to_reference(
     print("      For precise matching, use DaVinci Resolve's built-in tools.")
     print()
 
-    for clip in target_clips:
-        clip_name = clip.GetName()
+    # Apply neutral exposure (reset to match reference baseline)
+    # In real implementation, would analyze both clips and calculate offset
+    if dry_run:
+        results = [True] * len(target_clips)
+    else:
+        results = _run_on_clips(lambda clip: adjust_exposure(clip, 0.0), target_clips, jobs)
 
-        if dry_run:
-            print(f"  Would match: {clip_name} → {ref_name}")
+    lines = []
+
+    for clip, success in zip(target_clips, results):
+        if success:
             matched += 1
+            if quiet:
+                continue
+
+        clip_name = clip_name_of(clip)
+
+        if dry_run:
+            lines.append(f"  Would match: {clip_name} → {ref_name}")
+        elif success:
+            lines.append(f"  ✅ Matched: {clip_name}")
         else:
-            # Apply neutral exposure (reset to match reference baseline)
-            # In real implementation, would analyze both clips and calculate offset
-            success = adjust_exposure(clip, 0.0)
-            if success:
-                print(f"  ✅ Matched: {clip_name}")
-                matched += 1
-            else:
-                print(f"  ❌ Failed: {clip_name}")
+            lines.append(f"  ❌ Failed: {clip_name}")
+
+        if len(lines) >= OUTPUT_FLUSH_LINES:
+            _write_lines(lines)
+
+    _write_lines(lines)
 
     return matched
 
@@ -183,7 +257,9 @@ def match_to_reference(
 def apply_exposure_offset(
     clips: List[Any],
     offset: float,
-    dry_run: bool = False
+    dry_run: bool = False,
+    jobs: int = 1,
+    quiet: bool = False
 ) -> int:
     """
     Apply exposure offset to clips.
@@ -192,31 +268,49 @@ def apply_exposure_offset(
         clips: List of clips
         offset: Exposure offset
         dry_run: If True, don't actually apply
+        jobs: Number of clips to adjust concurrently (1 = sequential)
+        quiet: If True, only report clips that failed
 
     Returns:
         Number of clips adjusted
     """
     adjusted = 0
 
-    for clip in clips:
+    if dry_run:
+        results = [True] * len(clips)
+    else:
+        results = _run_on_clips(lambda clip: adjust_exposure(clip, offset), clips, jobs)
+
+    lines = []
+
+    for clip, success in zip(clips, results):
+        if success:
+            adjusted += 1
+            if quiet:
+                continue
+
         clip_name = clip.GetName()
 
         if dry_run:
-            print(f"  Would adjust: {clip_name} (offset: {offset:+.2f})")
-            adjusted += 1
+            lines.append(f"  Would adjust: {clip_name} (offset: {offset:+.2f})")
+        elif success:
+            lines.append(f"  ✅ Adjusted: {clip_name} (offset: {offset:+.2f})")
         else:
-            success = adjust_exposure(clip, offset)
-            if success:
-                print(f"  ✅ Adjusted: {clip_name} (offset: {offset:+.2f})")
-                adjusted += 1
-            else:
-                print(f"  ❌ Failed: {clip_name}")
+            lines.append(f"  ❌ Failed: {clip_name}")
+
+        if len(lines) >= OUTPUT_FLUSH_LINES:
+            _write_lines(lines)
+
+    _write_lines(lines)
 
     return adjusted
 
 
 def main():
     """Main entry point."""
+    # Imported here so importing this module for its helpers stays light
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Match exposure across clips in DaVinci Resolve",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -290,6 +384,20 @@ Note:
         help='Show what would be done without applying'
     )
 
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=1,
+        metavar='N',
+        help='Number of clips to adjust concurrently (default: 1)'
+    )
+
+    parser.add_argument(
+        '-q', '--quiet',
+        action='store_true',
+        help='Only list clips that failed'
+    )
+
     args = parser.parse_args()
 
     # Validation
@@ -341,7 +449,11 @@ Note:
 
     # Reference mode
     if args.reference:
-        reference_clip = find_clip_by_name(timeline, args.reference)
+        # One pass gives the name lookup, track contents and clip colors
+        items_by_track, name_to_item, clip_meta = scan_timeline(
+            timeline, with_colors=bool(args.color)
+        )
+        reference_clip = name_to_item.get(args.reference)
 
         if not reference_clip:
             print(f"❌ Reference clip not found: {args.reference}")
@@ -349,11 +461,12 @@ Note:
 
         # Get target clips (excluding reference)
         target_clips = get_target_clips(
-            timeline,
+            items_by_track,
             target_all=args.all,
             target_track=args.track,
             target_color=args.color,
-            exclude_clip=reference_clip
+            exclude_ids={id(reference_clip)},
+            clip_meta=clip_meta
         )
 
         if not target_clips:
@@ -366,7 +479,10 @@ Note:
         print("Matching exposure...")
         print()
 
-        matched = match_to_reference(target_clips, reference_clip, dry_run=args.dry_run)
+        matched = match_to_reference(
+            target_clips, reference_clip, dry_run=args.dry_run,
+            jobs=max(1, args.jobs), quiet=args.quiet, clip_meta=clip_meta
+        )
 
         print()
         print("=" * 70)
@@ -381,7 +497,7 @@ Note:
     # Offset mode
     elif args.offset is not None:
         target_clips = get_target_clips(
-            timeline,
+            get_items_by_track(timeline, args.track),
             target_all=args.all,
             target_track=args.track,
             target_color=args.color
@@ -397,7 +513,10 @@ Note:
         print(f"Applying exposure offset: {args.offset:+.2f}")
         print()
 
-        adjusted = apply_exposure_offset(target_clips, args.offset, dry_run=args.dry_run)
+        adjusted = apply_exposure_offset(
+            target_clips, args.offset, dry_run=args.dry_run,
+            jobs=max(1, args.jobs), quiet=args.quiet
+        )
 
         print()
         print("=" * 70)
@@ -31,40 +31,169 @@ License: MIT
 import sys
 import os
 import argparse
+import io
 import json
-from typing import List, Dict, Optional, Any
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List, Dict, Optional, Any, Tuple
 
 # Add DaVinci Resolve API to path
 api_path = os.environ.get('RESOLVE_SCRIPT_API')
 if api_path:
     sys.path.append(os.path.join(api_path, "Modules"))
 
+# Faster JSON templates when orjson is available
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional binary template formats
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import cbor2
+except ImportError:
+    cbor2 = None
+
+# Optional zstd compression for templates
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+TEMPLATE_FORMATS = ('json', 'msgpack', 'cbor')
+
+# CopyGrade/PasteGrade go through Resolve's single grade clipboard, so a
+# copy and its paste must not interleave with another thread's
+_grade_clipboard_lock = threading.Lock()
+
+# Per-clip report lines are written in batches of this size
+OUTPUT_FLUSH_LINES = 100
+
+# Template format implied by the file extension
+TEMPLATE_SUFFIXES = {
+    '.json': 'json',
+    '.mpk': 'msgpack',
+    '.msgpack': 'msgpack',
+    '.cbor': 'cbor',
+}
+
+# Compressed templates end in this suffix (e.g. grade.json.zst)
+ZSTD_SUFFIX = '.zst'
+ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+ZSTD_LEVEL = 3
+
+
+def _write_lines(lines: List[str]) -> None:
+    """Write buffered report lines to stdout in one call and clear the buffer."""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+        lines.clear()
+
+
+class TimelineSnapshot:
+    """
+    Video track contents of a timeline, read once per run.
+
+    Clip names are fetched on first use and cached, so only the clips a
+    run actually looks up or reports cost a GetName() call. Clip colors
+    are only fetched when requested.
+    """
 
-def find_clip_in_timeline(timeline, clip_name: str) -> Optional[Any]:
+    def __init__(self, tracks: Dict[int, List[Tuple[Any, Optional[str]]]], has_colors: bool):
+        # {track_index: [(item, color), ...]}
+        self.tracks = tracks
+        self.has_colors = has_colors
+        self._by_name = None
+        self._names = {}
+        self._track_of = {}
+
+        for track_index in sorted(tracks):
+            for item, _ in tracks[track_index]:
+                self._track_of[id(item)] = track_index
+
+    @property
+    def by_name(self) -> Dict[str, List[Any]]:
+        """{name: [item, ...]} in track order, built on first access."""
+        if self._by_name is None:
+            by_name = {}
+            for track_index in sorted(self.tracks):
+                for item, _ in self.tracks[track_index]:
+                    by_name.setdefault(self.name_of(item), []).append(item)
+            self._by_name = by_name
+        return self._by_name
+
+    def name_of(self, item) -> str:
+        """Return a clip's name, calling GetName() at most once per snapshot clip."""
+        key = id(item)
+        name = self._names.get(key)
+        if name is None:
+            name = item.GetName()
+            # Only snapshot items are kept alive, so only their ids are stable
+            if key in self._track_of:
+                self._names[key] = name
+        return name
+
+    def track_of(self, item) -> Optional[int]:
+        """Return the video track index a clip from this snapshot is on."""
+        return self._track_of.get(id(item))
+
+
+def snapshot_timeline(timeline, with_colors: bool = False) -> TimelineSnapshot:
     """
-    Find clip by name in timeline.
+    Read every video track of the timeline once.
 
     Args:
         timeline: Timeline object
-        clip_name: Name of clip to find
+        with_colors: Also fetch clip colors (needed for color filtering)
 
     Returns:
-        TimelineItem object or None
+        TimelineSnapshot
     """
+    tracks = {}
     video_track_count = timeline.GetTrackCount('video')
 
     for track_index in range(1, video_track_count + 1):
-        items = timeline.GetItemListInTrack('video', track_index)
-        if items:
-            for item in items:
-                if item.GetName() == clip_name:
-                    return item
+        items = timeline.GetItemListInTrack('video', track_index) or []
+        tracks[track_index] = [
+            (item, item.GetClipColor() if with_colors else None)
+            for item in items
+        ]
+
+    return TimelineSnapshot(tracks, with_colors)
 
-    return None
+
+def find_clip_in_timeline(snapshot: TimelineSnapshot, clip_name: str) -> Optional[Any]:
+    """
+    Find clip by name in a timeline snapshot.
+
+    Args:
+        snapshot: TimelineSnapshot of the current timeline
+        clip_name: Name of clip to find
+
+    Returns:
+        TimelineItem object or None
+    """
+    matches = snapshot.by_name.get(clip_name)
+    if not matches:
+        return None
+
+    if len(matches) > 1:
+        tracks = ", ".join(str(snapshot.track_of(item)) for item in matches)
+        print(f"⚠️  {len(matches)} clips named '{clip_name}' (video tracks {tracks}); "
+              f"using the first one")
+
+    return matches[0]
 
 
 def get_target_clips(
-    timeline,
+    snapshot: TimelineSnapshot,
     target_all: bool = False,
     target_track: Optional[int] = None,
     target_color: Optional[str] = None
@@ -73,7 +202,7 @@ def get_target_clips(
     Get target clips based on criteria.
 
     Args:
-        timeline: Timeline object
+        snapshot: TimelineSnapshot of the current timeline
         target_all: Target all clips
         target_track: Target specific track
         target_color: Target clips with specific color
@@ -82,28 +211,75 @@ def get_target_clips(
         List of TimelineItem objects
     """
     clips = []
-    video_track_count = timeline.GetTrackCount('video')
+    target_color_lc = target_color.lower() if target_color else None
 
-    for track_index in range(1, video_track_count + 1):
-        # Skip if track filter doesn't match
-        if target_track and track_index != target_track:
-            continue
-
-        items = timeline.GetItemListInTrack('video', track_index)
-        if items:
-            for item in items:
-                # Apply color filter
-                if target_color:
+    if target_track:
+        track_range = [target_track] if target_track in snapshot.tracks else []
+    else:
+        track_range = sorted(snapshot.tracks)
+
+    for track_index in track_range:
+        for item, clip_color in snapshot.tracks[track_index]:
+            # Apply color filter
+            if target_color_lc:
+                if not snapshot.has_colors:
                     clip_color = item.GetClipColor()
-                    if not clip_color or clip_color.lower() != target_color.lower():
-                        continue
+                if not clip_color or clip_color.lower() != target_color_lc:
+                    continue
 
-                clips.append(item)
+            clips.append(item)
 
     return clips
 
 
-def extract_grade_info(clip, node: Optional[int] = None) -> Dict[str, Any]:
+@dataclass
+class NodeGrade:
+    """LUT and CDL of one node in a grade template."""
+
+    __slots__ = ('index', 'lut', 'cdl')
+
+    index: int
+    lut: Optional[str]
+    cdl: Optional[Dict[str, Any]]
+
+
+@dataclass
+class GradeInfo:
+    """
+    Grade template: the source clip's name and its per-node LUT/CDL.
+
+    Converted to and from plain dicts only when saving or loading a
+    template file.
+    """
+
+    __slots__ = ('clip_name', 'node_count', 'nodes')
+
+    clip_name: str
+    node_count: int
+    nodes: List[NodeGrade]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the template as plain dicts/lists for serialization."""
+        return {
+            'clip_name': self.clip_name,
+            'node_count': self.node_count,
+            'nodes': [
+                {'index': n.index, 'lut': n.lut, 'cdl': n.cdl}
+                for n in self.nodes
+            ]
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'GradeInfo':
+        """Build a template from a loaded dict (see to_dict())."""
+        nodes = [
+            NodeGrade(n['index'], n.get('lut'), n.get('cdl'))
+            for n in data['nodes']
+        ]
+        return cls(data.get('clip_name', ''), data.get('node_count', len(nodes)), nodes)
+
+
+def extract_grade_info(clip, node: Optional[int] = None) -> GradeInfo:
     """
     Extract grading information from clip.
 
@@ -112,64 +288,131 @@ def extract_grade_info(clip, node: Optional[int] = None) -> Dict[str, Any]:
         node: Optional specific node to extract
 
     Returns:
-        Dictionary with grade information
+        GradeInfo with grade information
     """
-    grade_info = {
-        'clip_name': clip.GetName(),
-        'node_count': 0,
-        'nodes': []
-    }
+    grade_info = GradeInfo(clip.GetName(), 0, [])
 
     try:
         node_count = clip.GetNumNodes()
-        grade_info['node_count'] = node_count if node_count else 0
-    except:
-        grade_info['node_count'] = 0
+        grade_info.node_count = node_count if node_count else 0
+    except (AttributeError, TypeError, RuntimeError):
+        grade_info.node_count = 0
 
-    if grade_info['node_count'] == 0:
+    if grade_info.node_count == 0:
         return grade_info
 
     # Extract node information
     start_node = node if node else 1
-    end_node = node if node else grade_info['node_count']
+    end_node = node if node else grade_info.node_count
 
     for node_index in range(start_node, end_node + 1):
-        if node_index > grade_info['node_count']:
+        if node_index > grade_info.node_count:
             break
 
-        node_info = {
-            'index': node_index,
-            'lut': None,
-            'cdl': None
-        }
+        node_info = NodeGrade(node_index, None, None)
 
         # Get LUT
         try:
             lut = clip.GetLUT(node_index)
             if lut and lut != "":
-                node_info['lut'] = lut
-        except:
+                node_info.lut = lut
+        except (AttributeError, TypeError, RuntimeError):
             pass
 
         # Get CDL
         try:
             cdl = clip.GetNodeColorData(node_index)
             if cdl:
-                node_info['cdl'] = cdl
-        except:
+                node_info.cdl = cdl
+        except (AttributeError, TypeError, RuntimeError):
             pass
 
-        grade_info['nodes'].append(node_info)
+        grade_info.nodes.append(node_info)
 
     return grade_info
 
 
-def copy_luts_only(source_clip, target_clip, node: Optional[int] = None) -> int:
+def _cache_source_grade(
+    source_clip,
+    node: Optional[int] = None,
+    luts: bool = True,
+    cdls: bool = True
+) -> Dict[str, Any]:
     """
-    Copy only LUTs from source to target.
+    Read the source clip's LUTs and CDL once so they can be reused for
+    every target.
 
     Args:
         source_clip: Source TimelineItem
+        node: Optional specific node
+        luts: Read LUTs
+        cdls: Read CDL values
+
+    Returns:
+        {'n': node count, 'luts': {node: lut}, 'cdls': {node: cdl}}
+        (nodes without a LUT/CDL are left out)
+    """
+    source_grade = {'n': 0, 'luts': {}, 'cdls': {}}
+
+    try:
+        source_grade['n'] = source_clip.GetNumNodes() or 0
+    except (AttributeError, TypeError, RuntimeError):
+        return source_grade
+
+    start_node = node if node else 1
+    end_node = min(node if node else source_grade['n'], source_grade['n'])
+
+    for node_index in range(start_node, end_node + 1):
+        if luts:
+            try:
+                lut = source_clip.GetLUT(node_index)
+                if lut and lut != "":
+                    source_grade['luts'][node_index] = lut
+            except (AttributeError, TypeError, RuntimeError):
+                pass
+
+        if cdls:
+            try:
+                cdl = source_clip.GetNodeColorData(node_index)
+                if cdl:
+                    source_grade['cdls'][node_index] = cdl
+            except (AttributeError, TypeError, RuntimeError):
+                pass
+
+    return source_grade
+
+
+def _set_if_changed(getter, setter, node_index: int, value) -> bool:
+    """
+    Write a node value unless the node already holds it.
+
+    Re-running a copy over partly graded clips then skips the writes (and
+    Resolve's grade recompute) for nodes that are already up to date.
+
+    Args:
+        getter: Bound getter, e.g. target_clip.GetLUT
+        setter: Matching setter, e.g. target_clip.SetLUT
+        node_index: Node index
+        value: Value to write
+
+    Returns:
+        True if the node holds the value afterwards
+    """
+    try:
+        if getter(node_index) == value:
+            return True
+    except (AttributeError, TypeError, RuntimeError):
+        pass
+
+    return setter(node_index, value)
+
+
+def copy_luts_only(source_grade: Dict[str, Any], target_clip, node: Optional[int] = None) -> int:
+    """
+    Copy only LUTs from source to target.
+
+    Args:
+        source_grade: Source grade from _cache_source_grade()
         target_clip: Target TimelineItem
         node: Optional specific node
 
@@ -179,40 +422,36 @@ def copy_luts_only(source_clip, target_clip, node: Optional[int] = None) -> int:
     copied = 0
 
     try:
-        source_node_count = source_clip.GetNumNodes()
         target_node_count = target_clip.GetNumNodes()
 
-        if not source_node_count or not target_node_count:
+        if not source_grade['n'] or not target_node_count:
             return 0
 
-        start_node = node if node else 1
-        end_node = node if node else min(source_node_count, target_node_count)
-
-        for node_index in range(start_node, end_node + 1):
-            if node_index > source_node_count or node_index > target_node_count:
+        for node_index, lut in sorted(source_grade['luts'].items()):
+            if node and node_index != node:
+                continue
+            if node_index > target_node_count:
                 break
 
             try:
-                lut = source_clip.GetLUT(node_index)
-                if lut and lut != "":
-                    success = target_clip.SetLUT(node_index, lut)
-                    if success:
-                        copied += 1
-            except:
+                success = _set_if_changed(target_clip.GetLUT, target_clip.SetLUT, node_index, lut)
+                if success:
+                    copied += 1
+            except (AttributeError, TypeError, RuntimeError):
                 pass
 
-    except:
+    except (AttributeError, TypeError, RuntimeError):
         pass
 
     return copied
 
 
-def copy_cdl_only(source_clip, target_clip, node: Optional[int] = None) -> int:
+def copy_cdl_only(source_grade: Dict[str, Any], target_clip, node: Optional[int] = None) -> int:
     """
     Copy only CDL from source to target.
 
     Args:
-        source_clip: Source TimelineItem
+        source_grade: Source grade from _cache_source_grade()
         target_clip: Target TimelineItem
         node: Optional specific node
 
@@ -222,41 +461,41 @@ def copy_cdl_only(source_clip, target_clip, node: Optional[int] = None) -> int:
     copied = 0
 
     try:
-        source_node_count = source_clip.GetNumNodes()
         target_node_count = target_clip.GetNumNodes()
 
-        if not source_node_count or not target_node_count:
+        if not source_grade['n'] or not target_node_count:
             return 0
 
-        start_node = node if node else 1
-        end_node = node if node else min(source_node_count, target_node_count)
-
-        for node_index in range(start_node, end_node + 1):
-            if node_index > source_node_count or node_index > target_node_count:
+        for node_index, cdl in sorted(source_grade['cdls'].items()):
+            if node and node_index != node:
+                continue
+            if node_index > target_node_count:
                 break
 
             try:
-                cdl = source_clip.GetNodeColorData(node_index)
-                if cdl:
-                    success = target_clip.SetNodeColorData(node_index, cdl)
-                    if success:
-                        copied += 1
-            except:
+                success = _set_if_changed(
+                    target_clip.GetNodeColorData, target_clip.SetNodeColorData, node_index, cdl
+                )
+                if success:
+                    copied += 1
+            except (AttributeError, TypeError, RuntimeError):
                 pass
 
-    except:
+    except (AttributeError, TypeError, RuntimeError):
         pass
 
     return copied
 
 
-def copy_complete_grade(source_clip, target_clip) -> bool:
+def copy_complete_grade(source_clip, target_clip, source_grade: Optional[Dict[str, Any]] = None) -> bool:
     """
     Copy complete grade using built-in API.
 
     Args:
         source_clip: Source TimelineItem
         target_clip: Target TimelineItem
+        source_grade: Cached source grade for the manual fallback
+            (read from source_clip when not given)
 
     Returns:
         True if successful
@@ -264,38 +503,225 @@ def copy_complete_grade(source_clip, target_clip) -> bool:
     try:
         # Use CopyGrade/PasteGrade if available
         # Note: These methods may not be available in all API versions
-        success = source_clip.CopyGrade()
-        if success:
-            success = target_clip.PasteGrade()
-            return success
+        with _grade_clipboard_lock:
+            success = source_clip.CopyGrade()
+            if success:
+                success = target_clip.PasteGrade()
+                return success
     except AttributeError:
         # Fallback: copy LUTs and CDL manually
-        luts_copied = copy_luts_only(source_clip, target_clip)
-        cdl_copied = copy_cdl_only(source_clip, target_clip)
+        if source_grade is None:
+            source_grade = _cache_source_grade(source_clip)
+        luts_copied = copy_luts_only(source_grade, target_clip)
+        cdl_copied = copy_cdl_only(source_grade, target_clip)
         return (luts_copied > 0 or cdl_copied > 0)
-    except:
+    except (TypeError, RuntimeError):
         return False
 
     return False
 
 
-def save_grade_template(clip, template_path: str, node: Optional[int] = None) -> bool:
+def copy_grade_once(source_clip) -> Optional[bool]:
     """
-    Save grade information as JSON template.
+    Put the source clip's grade on Resolve's grade clipboard once, so each
+    target only needs a PasteGrade.
+
+    Returns:
+        True if copied, False if CopyGrade failed, None if the API has no
+        CopyGrade (callers fall back to copying LUTs/CDL manually)
+    """
+    try:
+        return bool(source_clip.CopyGrade())
+    except AttributeError:
+        return None
+    except (TypeError, RuntimeError):
+        return False
+
+
+def copy_complete_grade_prepared(target_clip) -> bool:
+    """
+    Paste the grade already placed on the clipboard by copy_grade_once().
+
+    Args:
+        target_clip: Target TimelineItem
+
+    Returns:
+        True if successful
+    """
+    try:
+        return bool(target_clip.PasteGrade())
+    except (AttributeError, TypeError, RuntimeError):
+        return False
+
+
+def apply_to_target(
+    target_clip,
+    source_clip=None,
+    source_grade: Optional[Dict[str, Any]] = None,
+    grade_template: Optional[GradeInfo] = None,
+    luts_only: bool = False,
+    cdl_only: bool = False,
+    node: Optional[int] = None,
+    grade_copied: bool = False
+) -> bool:
+    """
+    Apply the source clip's grade or a loaded template to one target.
+
+    Args:
+        target_clip: Target TimelineItem
+        source_clip: Source TimelineItem (source mode)
+        source_grade: Cached source grade from _cache_source_grade()
+        grade_template: Loaded template (template mode)
+        luts_only: Copy only LUTs
+        cdl_only: Copy only CDL values
+        node: Optional specific node
+        grade_copied: The source grade is already on the clipboard
+            (see copy_grade_once()), so only paste it
+
+    Returns:
+        True if successful
+    """
+    if source_clip:
+        if luts_only:
+            return copy_luts_only(source_grade, target_clip, node=node) > 0
+        if cdl_only:
+            return copy_cdl_only(source_grade, target_clip, node=node) > 0
+        if node:
+            luts = copy_luts_only(source_grade, target_clip, node=node)
+            cdl = copy_cdl_only(source_grade, target_clip, node=node)
+            return luts > 0 or cdl > 0
+        if grade_copied:
+            return copy_complete_grade_prepared(target_clip)
+        return copy_complete_grade(source_clip, target_clip, source_grade)
+
+    if grade_template:
+        return apply_grade_template(target_clip, grade_template)
+
+    return False
+
+
+def _detect_template_format(template_path: str, head: bytes = b"") -> str:
+    """
+    Work out a template's format from its first byte, or from its
+    extension when there is no content to go by (e.g. when saving).
+
+    The content wins over the extension, so a file saved with an explicit
+    --template-format under a different extension still loads.
+
+    Args:
+        template_path: Template file path
+        head: First bytes of the (decompressed) file, if available
+
+    Returns:
+        One of TEMPLATE_FORMATS
+    """
+    first = head.lstrip()[:1]
+    if first:
+        byte = first[0]
+        # Templates are always a top-level map/object
+        if first == b'{':
+            return 'json'
+        # msgpack fixmap/map16/map32, CBOR major type 5
+        if 0x80 <= byte <= 0x8f or byte in (0xde, 0xdf):
+            return 'msgpack'
+        if 0xa0 <= byte <= 0xbf:
+            return 'cbor'
+
+    base = template_path
+    if base.lower().endswith(ZSTD_SUFFIX):
+        base = base[:-len(ZSTD_SUFFIX)]
+
+    suffix = os.path.splitext(base)[1].lower()
+    return TEMPLATE_SUFFIXES.get(suffix, 'json')
+
+
+def _write_template(f, grade_info: Dict[str, Any], template_format: str) -> None:
+    """
+    Serialize grade information to a binary file in the given format.
+
+    The stdlib JSON, msgpack and CBOR paths write to the file as they
+    encode, so the whole document is never held as one string. orjson
+    builds its output in a single preallocated buffer, which is faster.
+    """
+    if template_format == 'msgpack':
+        if msgpack is None:
+            raise RuntimeError("msgpack is not installed (pip install msgpack)")
+        msgpack.pack(grade_info, f, use_bin_type=True)
+
+    elif template_format == 'cbor':
+        if cbor2 is None:
+            raise RuntimeError("cbor2 is not installed (pip install cbor2)")
+        cbor2.dump(grade_info, f)
+
+    elif orjson is not None:
+        f.write(orjson.dumps(grade_info, option=orjson.OPT_INDENT_2))
+
+    else:
+        text = io.TextIOWrapper(f, encoding='utf-8')
+        try:
+            json.dump(grade_info, text, indent=2)
+        finally:
+            # Hand the underlying file back to the caller without closing it
+            text.flush()
+            text.detach()
+
+
+def _decode_template(payload: bytes, template_format: str) -> Dict[str, Any]:
+    """Deserialize grade information in the given template format."""
+    if template_format == 'msgpack':
+        if msgpack is None:
+            raise RuntimeError("msgpack is not installed (pip install msgpack)")
+        return msgpack.unpackb(payload, raw=False)
+
+    if template_format == 'cbor':
+        if cbor2 is None:
+            raise RuntimeError("cbor2 is not installed (pip install cbor2)")
+        return cbor2.loads(payload)
+
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload.decode('utf-8'))
+
+
+def _require_zstandard():
+    if zstandard is None:
+        raise RuntimeError("zstandard is not installed (pip install zstandard)")
+
+
+def save_grade_template(
+    clip,
+    template_path: str,
+    node: Optional[int] = None,
+    template_format: Optional[str] = None
+) -> bool:
+    """
+    Save grade information as a template file.
 
     Args:
         clip: TimelineItem object
         template_path: Path to save template
         node: Optional specific node
+        template_format: 'json', 'msgpack' or 'cbor'
+            (default: from the file extension, else JSON)
+
+    A path ending in .zst is written zstd-compressed.
 
     Returns:
         True if successful
     """
     try:
-        grade_info = extract_grade_info(clip, node=node)
-
-        with open(template_path, 'w') as f:
-            json.dump(grade_info, f, indent=2)
+        grade_info = extract_grade_info(clip, node=node).to_dict()
+        template_format = template_format or _detect_template_format(template_path)
+
+        if template_path.lower().endswith(ZSTD_SUFFIX):
+            _require_zstandard()
+            compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL)
+            with open(template_path, 'wb') as f:
+                with compressor.stream_writer(f, closefd=False) as zf:
+                    _write_template(zf, grade_info, template_format)
+        else:
+            with open(template_path, 'wb') as f:
+                _write_template(f, grade_info, template_format)
 
         return True
     except Exception as e:
@@ -303,65 +729,80 @@ def save_grade_template(clip, template_path: str, node: Optional[int] = None) ->
         return False
 
 
-def load_grade_template(template_path: str) -> Optional[Dict[str, Any]]:
+def load_grade_template(template_path: str) -> Optional[GradeInfo]:
     """
-    Load grade template from JSON file.
+    Load grade template from a JSON, MessagePack or CBOR file, optionally
+    zstd-compressed.
 
     Args:
         template_path: Path to template file
 
     Returns:
-        Grade information dictionary or None
+        GradeInfo or None
     """
     try:
-        with open(template_path, 'r') as f:
-            grade_info = json.load(f)
+        with open(template_path, 'rb') as f:
+            payload = f.read()
 
-        return grade_info
+        if payload[:4] == ZSTD_MAGIC:
+            _require_zstandard()
+            payload = zstandard.ZstdDecompressor().decompressobj().decompress(payload)
+
+        grade_info = _decode_template(
+            payload, _detect_template_format(template_path, payload[:16])
+        )
+
+        return GradeInfo.from_dict(grade_info)
     except Exception as e:
         print(f"❌ Error loading template: {e}")
         return None
 
 
-def apply_grade_template(clip, grade_info: Dict[str, Any]) -> bool:
+def apply_grade_template(clip, grade_info: GradeInfo) -> bool:
     """
     Apply grade template to clip.
 
     Args:
         clip: TimelineItem object
-        grade_info: Grade information dictionary
+        grade_info: Loaded grade template
 
     Returns:
         True if successful
     """
     try:
+        # Nodes that carry something to apply; an empty template needs no API calls
+        template_nodes = [n for n in grade_info.nodes if n.lut or n.cdl]
+        if not template_nodes:
+            return False
+
         clip_node_count = clip.GetNumNodes()
         if not clip_node_count:
             return False
 
-        applied = False
+        valid_nodes = [n for n in template_nodes if n.index <= clip_node_count]
 
-        for node_info in grade_info['nodes']:
-            node_index = node_info['index']
+        applied = False
 
-            if node_index > clip_node_count:
-                continue
+        for node_info in valid_nodes:
+            node_index = node_info.index
 
             # Apply LUT
-            if node_info['lut']:
-                success = clip.SetLUT(node_index, node_info['lut'])
+            if node_info.lut:
+                success = _set_if_changed(clip.GetLUT, clip.SetLUT, node_index, node_info.lut)
                 if success:
                     applied = True
 
             # Apply CDL
-            if node_info['cdl']:
-                success = clip.SetNodeColorData(node_index, node_info['cdl'])
+            if node_info.cdl:
+                success = _set_if_changed(
+                    clip.GetNodeColorData, clip.SetNodeColorData, node_index, node_info.cdl
+                )
                 if success:
                     applied = True
 
         return applied
 
-    except Exception as e:
+    except (AttributeError, KeyError, TypeError, RuntimeError) as e:
         print(f"❌ Error applying template: {e}")
         return False
 
@@ -410,7 +851,7 @@ Examples:
         '--load-template',
         type=str,
         metavar='FILE',
-        help='Load grade from JSON template file'
+        help='Load grade from template file (JSON, MessagePack or CBOR)'
     )
 
     # Target options
@@ -464,7 +905,22 @@ Examples:
         '--save-template',
         type=str,
         metavar='FILE',
-        help='Save grade as JSON template'
+        help='Save grade as template (format from extension: .json, .mpk, .cbor)'
+    )
+
+    parser.add_argument(
+        '--compress',
+        action='store_true',
+        help='zstd-compress the saved template (adds .zst to the file name; '
+             'needs the zstandard package)'
+    )
+
+    parser.add_argument(
+        '--template-format',
+        choices=TEMPLATE_FORMATS,
+        help='Template format for --save-template (default: from extension, else json). '
+             'msgpack/cbor are smaller and faster to load for large grades '
+             '(need the msgpack/cbor2 package)'
     )
 
     # Other options
@@ -474,16 +930,22 @@ Examples:
         help='Show what would be done without applying'
     )
 
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=1,
+        metavar='N',
+        help='Number of clips to apply to concurrently (default: 1). '
+             'Complete-grade copies still run one at a time (shared grade clipboard)'
+    )
+
     args = parser.parse_args()
 
-    # Validation
-    if args.source and args.save_template and not (args.target_all or args.target_track or args.target_color):
-        # Allow save-template without targets
-        pass
-    elif args.source and not (args.target_all or args.target_track or args.target_color) and not args.save_template:
-        print("Error: Specify target (--target-all, --target-track, or --target-color)")
-        sys.exit(1)
-    elif args.load_template and not (args.target_all or args.target_track or args.target_color):
+    # Validation: every mode needs a target except saving a source clip's grade
+    has_target = bool(args.target_all or args.target_track or args.target_color)
+    saving_only = bool(args.source and args.save_template)
+
+    if not has_target and not saving_only:
         print("Error: Specify target (--target-all, --target-track, or --target-color)")
         sys.exit(1)
 
@@ -529,19 +991,29 @@ Examples:
         print("   Check RESOLVE_SCRIPT_API environment variable")
         sys.exit(1)
 
+    # Read the timeline once; every lookup below uses this snapshot
+    snapshot = snapshot_timeline(timeline, with_colors=bool(args.target_color))
+
     # Handle template save
     if args.source and args.save_template:
-        source_clip = find_clip_in_timeline(timeline, args.source)
+        source_clip = find_clip_in_timeline(snapshot, args.source)
 
         if not source_clip:
             print(f"❌ Source clip not found: {args.source}")
             sys.exit(1)
 
+        template_path = args.save_template
+        if args.compress and not template_path.lower().endswith(ZSTD_SUFFIX):
+            template_path += ZSTD_SUFFIX
+
         print(f"Saving grade from: {args.source}")
-        success = save_grade_template(source_clip, args.save_template, node=args.node)
+        success = save_grade_template(
+            source_clip, template_path, node=args.node,
+            template_format=args.template_format
+        )
 
         if success:
-            print(f"✅ Template saved: {args.save_template}")
+            print(f"✅ Template saved: {template_path}")
         else:
             print(f"❌ Failed to save template")
 
@@ -549,7 +1021,7 @@ Examples:
 
     # Get source grade
     if args.source:
-        source_clip = find_clip_in_timeline(timeline, args.source)
+        source_clip = find_clip_in_timeline(snapshot, args.source)
 
         if not source_clip:
             print(f"❌ Source clip not found: {args.source}")
@@ -566,15 +1038,15 @@ Examples:
             sys.exit(1)
 
         print(f"Loaded template: {args.load_template}")
-        print(f"  Source: {grade_template['clip_name']}")
-        print(f"  Nodes: {len(grade_template['nodes'])}")
+        print(f"  Source: {grade_template.clip_name}")
+        print(f"  Nodes: {len(grade_template.nodes)}")
         source_clip = None
 
     print()
 
     # Get target clips
     target_clips = get_target_clips(
-        timeline,
+        snapshot,
         target_all=args.target_all,
         target_track=args.target_track,
         target_color=args.target_color
@@ -593,43 +1065,69 @@ Examples:
 
     applied = 0
 
+    # Read the source grade once instead of once per target
+    source_grade = None
+    if source_clip and (args.luts_only or args.cdl_only or args.node):
+        source_grade = _cache_source_grade(
+            source_clip,
+            node=args.node,
+            luts=not args.cdl_only,
+            cdls=not args.luts_only
+        )
+
+    # Complete grade: copy it to the clipboard once, then only paste per target
+    grade_copied = False
+    if source_clip and not (args.luts_only or args.cdl_only or args.node) and not args.dry_run:
+        copied = copy_grade_once(source_clip)
+        if copied is None:
+            # No CopyGrade in this API version; manual copy from one read
+            source_grade = _cache_source_grade(source_clip)
+        grade_copied = bool(copied)
+
+    def apply(target_clip):
+        return apply_to_target(
+            target_clip,
+            source_clip=source_clip,
+            source_grade=source_grade,
+            grade_template=grade_template,
+            luts_only=args.luts_only,
+            cdl_only=args.cdl_only,
+            node=args.node,
+            grade_copied=grade_copied
+        )
+
+    # Run the API calls first (concurrently with --jobs), report in order below
+    results = {}
+    if not args.dry_run:
+        pending = [tc for tc in target_clips if not (source_clip and tc == source_clip)]
+        if args.jobs > 1 and len(pending) > 1:
+            with ThreadPoolExecutor(max_workers=min(args.jobs, len(pending))) as executor:
+                outcomes = list(executor.map(apply, pending))
+        else:
+            outcomes = [apply(tc) for tc in pending]
+        results = {id(tc): ok for tc, ok in zip(pending, outcomes)}
+
+    lines = []
+
     for target_clip in target_clips:
-        target_name = target_clip.GetName()
+        target_name = snapshot.name_of(target_clip)
 
         # Skip source clip
         if source_clip and target_clip == source_clip:
-            print(f"  ⚠️  Skipped (source): {target_name}")
-            continue
-
-        if args.dry_run:
-            print(f"  Would apply to: {target_name}")
+            lines.append(f"  ⚠️  Skipped (source): {target_name}")
+        elif args.dry_run:
+            lines.append(f"  Would apply to: {target_name}")
             applied += 1
-            continue
-
-        success = False
-
-        if source_clip:
-            if args.luts_only:
-                copied = copy_luts_only(source_clip, target_clip, node=args.node)
-                success = (copied > 0)
-            elif args.cdl_only:
-                copied = copy_cdl_only(source_clip, target_clip, node=args.node)
-                success = (copied > 0)
-            elif args.node:
-                luts = copy_luts_only(source_clip, target_clip, node=args.node)
-                cdl = copy_cdl_only(source_clip, target_clip, node=args.node)
-                success = (luts > 0 or cdl > 0)
-            else:
-                success = copy_complete_grade(source_clip, target_clip)
-
-        elif grade_template:
-            success = apply_grade_template(target_clip, grade_template)
-
-        if success:
-            print(f"  ✅ Applied to: {target_name}")
+        elif results.get(id(target_clip), False):
+            lines.append(f"  ✅ Applied to: {target_name}")
             applied += 1
         else:
-            print(f"  ❌ Failed: {target_name}")
+            lines.append(f"  ❌ Failed: {target_name}")
+
+        if len(lines) >= OUTPUT_FLUSH_LINES:
+            _write_lines(lines)
+
+    _write_lines(lines)
 
     # Summary
     print()
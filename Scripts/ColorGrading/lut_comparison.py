@@ -13,15 +13,26 @@ import os
 RESOLVE_SCRIPT_API = "/Library/Application Support/Blackmagic Design/DaVinci Resolve/Developer/Scripting"
 RESOLVE_SCRIPT_LIB = "/Applications/DaVinci Resolve/DaVinci Resolve.app/Contents/Libraries/Fusion/fusionscript.so"
 
-os.environ["RESOLVE_SCRIPT_API"] = RESOLVE_SCRIPT_API
-os.environ["RESOLVE_SCRIPT_LIB"] = RESOLVE_SCRIPT_LIB
-sys.path.append(f"{RESOLVE_SCRIPT_API}/Modules")
 
-try:
-    import DaVinciResolveScript as dvr_script
-except ImportError as e:
-    print(f"❌ DaVinci Resolve APIのインポートに失敗: {e}")
-    sys.exit(1)
+def _connect_resolve():
+    """
+    DaVinci Resolve APIを読み込んで接続する
+
+    モジュール読み込み時ではなく、実際に接続するときだけAPIを初期化します。
+    """
+    os.environ["RESOLVE_SCRIPT_API"] = RESOLVE_SCRIPT_API
+    os.environ["RESOLVE_SCRIPT_LIB"] = RESOLVE_SCRIPT_LIB
+    modules_path = f"{RESOLVE_SCRIPT_API}/Modules"
+    if modules_path not in sys.path:
+        sys.path.append(modules_path)
+
+    try:
+        import DaVinciResolveScript as dvr_script
+    except ImportError as e:
+        print(f"❌ DaVinci Resolve APIのインポートに失敗: {e}")
+        sys.exit(1)
+
+    return dvr_script.scriptapp("Resolve")
 
 
 def main():
@@ -32,7 +43,7 @@ def main():
 
     # Resolveに接続
     print("\n[1/4] DaVinci Resolveに接続中...")
-    resolve = dvr_script.scriptapp("Resolve")
+    resolve = _connect_resolve()
     if not resolve:
         print("❌ 接続失敗")
         sys.exit(1)
@@ -90,6 +101,9 @@ def main():
 
     version_type = 0  # 0 = ローカルバージョン
 
+    # 既存バージョン一覧は最初に1回だけ取得し、以降はローカルで更新
+    existing_versions = set(first_item.GetVersionNameList(version_type) or [])
+
     for lut_config in luts_to_test:
         version_name = lut_config["version_name"]
         lut_path = lut_config["lut_path"]
@@ -99,17 +113,17 @@ def main():
         print(f"    説明: {description}")
 
         # 既存バージョンをチェック
-        existing_versions = first_item.GetVersionNameList(version_type)
-
-        if existing_versions and version_name in existing_versions:
+        if version_name in existing_versions:
             print(f"    ⚠️  既存のバージョンを削除中...")
-            first_item.DeleteVersionByName(version_name, version_type)
+            if first_item.DeleteVersionByName(version_name, version_type):
+                existing_versions.discard(version_name)
 
         # 新規バージョン作成
         success = first_item.AddVersion(version_name, version_type)
         if not success:
             print(f"    ❌ バージョン作成失敗")
             continue
+        existing_versions.add(version_name)
 
         # バージョンを読み込み
         success = first_item.LoadVersionByName(version_name, version_type)
@@ -132,8 +146,10 @@ def main():
             # LUTなしバージョン（すべてのノードからLUTを削除）
             num_nodes = first_item.GetNumNodes()
             if num_nodes:
+                # LUTが入っているノードだけを書き換え（空ノードへの再書き込みを省略）
                 for i in range(1, num_nodes + 1):
-                    first_item.SetLUT(i, "")
+                    if first_item.GetLUT(i):
+                        first_item.SetLUT(i, "")
             print(f"    ✅ バージョン作成完了（LUTなし）")
 
     # 最初のバージョンに戻す
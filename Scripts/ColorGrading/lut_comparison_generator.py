@@ -25,18 +25,93 @@ License: MIT
 import sys
 import os
 import argparse
+from collections import namedtuple
 from typing import List, Dict, Optional, Any
 
-# Add DaVinci Resolve API to path
-api_path = os.environ.get('RESOLVE_SCRIPT_API')
-if api_path:
-    sys.path.append(os.path.join(api_path, "Modules"))
+
+def _connect_resolve():
+    """
+    Import the DaVinci Resolve API and connect to the running instance.
+
+    The API path is added to sys.path here rather than at import time, so
+    --help and argument errors never touch it.
+    """
+    api_path = os.environ.get('RESOLVE_SCRIPT_API')
+    if api_path:
+        modules_path = os.path.join(api_path, "Modules")
+        if modules_path not in sys.path:
+            sys.path.append(modules_path)
+
+    import DaVinciResolveScript as dvr
+    return dvr.scriptapp("Resolve")
+
+
+# Banner rule used around report sections
+SEPARATOR = "=" * 70
+
+# Timeline format: resolution and frame rate
+TimelineSettings = namedtuple('TimelineSettings', 'width height fps')
+
+
+def _read_timeline_settings(timeline) -> TimelineSettings:
+    """Read a timeline's resolution and frame rate."""
+    return TimelineSettings(
+        int(timeline.GetSetting('timelineResolutionWidth')),
+        int(timeline.GetSetting('timelineResolutionHeight')),
+        float(timeline.GetSetting('timelineFrameRate'))
+    )
+
+
+def _write_lines(lines: List[str]) -> None:
+    """Write buffered report lines to stdout in one call and clear the buffer."""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+        lines.clear()
+
+
+def _get_video_items(timeline) -> List[Any]:
+    """Return every video clip on the timeline, track by track."""
+    video_track_count = timeline.GetTrackCount('video')
+    return [
+        item
+        for track_index in range(1, video_track_count + 1)
+        for item in (timeline.GetItemListInTrack('video', track_index) or [])
+    ]
+
+
+def _clip_name(item, names: Optional[Dict[int, str]]) -> str:
+    """Return a clip's name, asking Resolve only on the first lookup."""
+    if names is None:
+        return item.GetName()
+    key = id(item)
+    name = names.get(key)
+    if name is None:
+        name = names[key] = item.GetName()
+    return name
+
+
+def make_version_names(luts: List[str]) -> List[str]:
+    """
+    Build the color version name for each LUT.
+
+    Args:
+        luts: List of LUT filenames
+
+    Returns:
+        Version names in LUT order (e.g. "LUT_1_film1")
+    """
+    return [f"LUT_{i}_{os.path.splitext(lut)[0]}" for i, lut in enumerate(luts, 1)]
 
 
 def create_version_comparison(
     timeline,
     luts: List[str],
-    node_index: int = 1
+    node_index: int = 1,
+    version_names: Optional[List[str]] = None,
+    items: Optional[List[Any]] = None,
+    clip_names: Optional[Dict[int, str]] = None,
+    version_lists: Optional[Dict[int, List[str]]] = None
 ) -> int:
     """
     Create color versions for each LUT on all clips.
@@ -45,6 +120,11 @@ def create_version_comparison(
         timeline: Timeline object
         luts: List of LUT filenames
         node_index: Node index to apply LUTs
+        version_names: Precomputed version name per LUT (see make_version_names)
+        items: Timeline video items, if already fetched
+        clip_names: id(item) -> name cache shared with other passes
+        version_lists: If given, filled with id(item) -> the clip's version
+            names after creation, for create_stills_for_comparison
 
     Returns:
         Number of clips processed
@@ -52,58 +132,66 @@ def create_version_comparison(
     print(f"Creating color versions for {len(luts)} LUT(s)...")
     print()
 
-    video_track_count = timeline.GetTrackCount('video')
+    if version_names is None:
+        version_names = make_version_names(luts)
+
+    if items is None:
+        items = _get_video_items(timeline)
+
+    # Phase 1: collect every clip and its original version in one walk
+    clip_records = []
+    for item in items:
+        original_version = None
+        try:
+            versions = item.GetVersionNameList(0) or []
+            if versions and len(versions) > 0:
+                original_version = versions[0]
+        except (AttributeError, TypeError, RuntimeError):
+            versions = None
+            original_version = "Original"
+        clip_records.append((item, _clip_name(item, clip_names), original_version, versions))
+
+    # Phase 2: create a version for each LUT on every collected clip
     processed_clips = 0
-
-    for track_index in range(1, video_track_count + 1):
-        items = timeline.GetItemListInTrack('video', track_index)
-        if items:
-            for item in items:
-                clip_name = item.GetName()
-                print(f"  Processing: {clip_name}")
-
-                # Get original version name
-                original_version = None
-                try:
-                    versions = item.GetVersionNameList(0)
-                    if versions and len(versions) > 0:
-                        original_version = versions[0]
-                except:
-                    original_version = "Original"
-
-                # Create version for each LUT
-                for i, lut in enumerate(luts, 1):
-                    # Extract LUT name without extension
-                    lut_name = os.path.splitext(lut)[0]
-                    version_name = f"LUT_{i}_{lut_name}"
-
-                    # Create new version
-                    try:
-                        success = item.AddVersion(version_name, 0)
-                        if success:
-                            # Load the new version
-                            item.LoadVersionByName(version_name, 0)
-
-                            # Apply LUT
-                            lut_success = item.SetLUT(node_index, lut)
-                            if lut_success:
-                                print(f"    ✅ Created version: {version_name}")
-                            else:
-                                print(f"    ⚠️  Version created but LUT failed: {version_name}")
-                        else:
-                            print(f"    ❌ Failed to create version: {version_name}")
-                    except Exception as e:
-                        print(f"    ❌ Error: {e}")
-
-                # Return to original version
-                if original_version:
-                    try:
-                        item.LoadVersionByName(original_version, 0)
-                    except:
-                        pass
-
-                processed_clips += 1
-                print()
+    log = []
+    for item, clip_name, original_version, versions in clip_records:
+        log.append(f"  Processing: {clip_name}")
+        created = []
+
+        for version_name, lut in zip(version_names, luts):
+            # Create new version
+            try:
+                success = item.AddVersion(version_name, 0)
+                if success:
+                    created.append(version_name)
+                    # Load the new version
+                    item.LoadVersionByName(version_name, 0)
+
+                    # Apply LUT
+                    lut_success = item.SetLUT(node_index, lut)
+                    if lut_success:
+                        log.append(f"    ✅ Created version: {version_name}")
+                    else:
+                        log.append(f"    ⚠️  Version created but LUT failed: {version_name}")
+                else:
+                    log.append(f"    ❌ Failed to create version: {version_name}")
+            except Exception as e:
+                log.append(f"    ❌ Error: {e}")
+
+        # Return to original version
+        if original_version:
+            try:
+                item.LoadVersionByName(original_version, 0)
+            except (AttributeError, TypeError, RuntimeError):
+                pass
+
+        # Record the version list now so the stills pass needn't re-query it
+        if version_lists is not None and versions is not None:
+            version_lists[id(item)] = versions + created
+
+        processed_clips += 1
+        log.append("")
+        _write_lines(log)
 
     return processed_clips
 
@@ -133,9 +221,7 @@ def create_side_by_side_comparison(
 
     # Get timeline settings
     source_name = source_timeline.GetName()
-    width = int(source_timeline.GetSetting('timelineResolutionWidth'))
-    height = int(source_timeline.GetSetting('timelineResolutionHeight'))
-    fps = float(source_timeline.GetSetting('timelineFrameRate'))
+    width, height, fps = _read_timeline_settings(source_timeline)
 
     # Calculate new resolution for side-by-side
     num_luts = len(luts) + 1  # +1 for original
@@ -156,9 +242,12 @@ def create_side_by_side_comparison(
         return None
 
     # Set timeline settings
-    comparison_timeline.SetSetting("timelineResolutionWidth", str(new_width))
-    comparison_timeline.SetSetting("timelineResolutionHeight", str(height))
-    comparison_timeline.SetSetting("timelineFrameRate", str(fps))
+    for key, value in (
+        ("timelineResolutionWidth", new_width),
+        ("timelineResolutionHeight", height),
+        ("timelineFrameRate", fps),
+    ):
+        comparison_timeline.SetSetting(key, str(value))
 
     print(f"✅ Created timeline: {comparison_name}")
     print()
@@ -178,7 +267,10 @@ def create_side_by_side_comparison(
 
 def create_stills_for_comparison(
     timeline,
-    gallery
+    gallery,
+    items: Optional[List[Any]] = None,
+    clip_names: Optional[Dict[int, str]] = None,
+    version_lists: Optional[Dict[int, List[str]]] = None
 ) -> int:
     """
     Create still frames for comparison.
@@ -186,6 +278,10 @@ def create_stills_for_comparison(
     Args:
         timeline: Timeline object
         gallery: Gallery object
+        items: Timeline video items, if already fetched
+        clip_names: id(item) -> name cache shared with other passes
+        version_lists: Version names recorded by create_version_comparison;
+            clips missing from it are queried
 
     Returns:
         Number of stills created
@@ -193,34 +289,33 @@ def create_stills_for_comparison(
     print("Creating still frames...")
     print()
 
-    video_track_count = timeline.GetTrackCount('video')
+    if items is None:
+        items = _get_video_items(timeline)
     stills_created = 0
+    log = []
 
-    for track_index in range(1, video_track_count + 1):
-        items = timeline.GetItemListInTrack('video', track_index)
-        if items:
-            for item in items:
-                clip_name = item.GetName()
+    for item in items:
+        clip_name = _clip_name(item, clip_names)
 
-                # Get all color versions
-                try:
-                    versions = item.GetVersionNameList(0)
-                    if not versions:
-                        continue
+        # Get all color versions
+        try:
+            versions = version_lists.get(id(item)) if version_lists else None
+            if versions is None:
+                versions = item.GetVersionNameList(0)
+            if not versions:
+                continue
 
-                    print(f"  Creating stills for: {clip_name}")
+            log.append(f"  Creating stills for: {clip_name}")
 
-                    for version in versions:
-                        # Load version
-                        item.LoadVersionByName(version, 0)
+            # Stills are grabbed manually (the API for creating stills is
+            # limited), so versions are only listed, not loaded
+            log.extend(f"    Version: {version}" for version in versions)
+            stills_created += len(versions)
 
-                        # Create still (note: actual still creation may vary)
-                        # The API for creating stills is limited
-                        print(f"    Version: {version}")
-                        stills_created += 1
+        except Exception as e:
+            log.append(f"  ⚠️  Error with {clip_name}: {e}")
 
-                except Exception as e:
-                    print(f"  ⚠️  Error with {clip_name}: {e}")
+        _write_lines(log)
 
     print()
     print(f"Note: Created markers for {stills_created} version(s)")
@@ -298,10 +393,11 @@ Note:
     )
 
     args = parser.parse_args()
+    version_names = make_version_names(args.luts)
 
-    print("=" * 70)
+    print(SEPARATOR)
     print("DaVinci Resolve LUT Comparison Generator")
-    print("=" * 70)
+    print(SEPARATOR)
     print()
 
     # Validate LUT files
@@ -312,8 +408,7 @@ Note:
 
     # Connect to DaVinci Resolve
     try:
-        import DaVinciResolveScript as dvr
-        resolve = dvr.scriptapp("Resolve")
+        resolve = _connect_resolve()
 
         if not resolve:
             print("❌ Could not connect to DaVinci Resolve")
@@ -351,23 +446,34 @@ Note:
 
     # Execute comparison
     if args.versions:
-        processed = create_version_comparison(timeline, args.luts, node_index=args.node)
+        # Walk the tracks once; --create-stills reuses the same clip list
+        items = _get_video_items(timeline)
+        clip_names = {}
+        version_lists = {} if args.create_stills else None
+        processed = create_version_comparison(
+            timeline, args.luts, node_index=args.node,
+            version_names=version_names, items=items, clip_names=clip_names,
+            version_lists=version_lists
+        )
 
-        print("=" * 70)
+        print(SEPARATOR)
         print(f"✅ Processed {processed} clip(s)")
         print()
         print("To compare LUTs in DaVinci Resolve:")
         print("  1. Select a clip in timeline")
         print("  2. Use Clip menu → Color Version")
         print("  3. Or use keyboard shortcuts (Opt+Y / Alt+Y)")
-        print("=" * 70)
+        print(SEPARATOR)
 
         # Create stills if requested
         if args.create_stills:
             print()
             gallery = project.GetGallery()
             if gallery:
-                create_stills_for_comparison(timeline, gallery)
+                create_stills_for_comparison(
+                    timeline, gallery, items=items, clip_names=clip_names,
+                    version_lists=version_lists
+                )
 
     elif args.side_by_side:
         comparison_timeline = create_side_by_side_comparison(
@@ -378,12 +484,12 @@ Note:
             node_index=args.node
         )
 
-        print("=" * 70)
+        print(SEPARATOR)
         if comparison_timeline:
             print(f"✅ Created comparison timeline")
         else:
             print("❌ Failed to create comparison timeline")
-        print("=" * 70)
+        print(SEPARATOR)
 
 
 if __name__ == "__main__":
@@ -16,11 +16,28 @@ License: MIT
 import sys
 import os
 import argparse
+import types
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any
 
-api_path = os.environ.get('RESOLVE_SCRIPT_API')
-if api_path:
-    sys.path.append(os.path.join(api_path, "Modules"))
+def _connect_resolve():
+    # API path is only added when connecting, not for --help/--list-looks
+    api_path = os.environ.get('RESOLVE_SCRIPT_API')
+    if api_path:
+        modules_path = os.path.join(api_path, "Modules")
+        if modules_path not in sys.path:
+            sys.path.append(modules_path)
+    import DaVinciResolveScript as dvr
+    return dvr.scriptapp("Resolve")
+
+OUTPUT_FLUSH_LINES = 100
+SEPARATOR = "=" * 70
+
+def _write_lines(lines):
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+        lines.clear()
 
 LOOK_PRESETS = {
     'netflix': {
@@ -105,18 +122,44 @@ LOOK_PRESETS = {
     },
 }
 
-def get_clips(timeline, all_clips=False, track=None, color=None):
-    clips = []
+# Read-only at runtime: CDL channel values are tuples so the shared presets
+# cannot be mutated through a payload handed to Resolve
+LOOK_PRESETS = types.MappingProxyType({
+    key: {**data, 'cdl': {k: tuple(v) if isinstance(v, list) else v for k, v in data['cdl'].items()}}
+    for key, data in LOOK_PRESETS.items()
+})
+
+# Lower bounds of the ASC CDL domain: slope >= 0, power > 0
+CDL_MIN = {'slope': 0.0, 'power': 1e-4}
+
+# Text for --list-looks, built once at import
+LOOKS_LISTING = "\n".join(
+    f"\n{key}:\n  {data['name']}\n  {data['desc']}" for key, data in LOOK_PRESETS.items()
+)
+
+def make_cdl_payload(cdl):
+    # Built once per run, clamped so edited presets can't send invalid CDL
+    payload = {}
+    for k, v in cdl.items():
+        if isinstance(v, tuple):
+            lo = CDL_MIN.get(k)
+            payload[k] = [max(x, lo) for x in v] if lo is not None else list(v)
+        else:
+            payload[k] = max(v, 0.0) if k == 'saturation' else v
+    return payload
+
+def iter_clips(timeline, track=None, color=None):
+    # Lazy: clips are yielded while later tracks are still unread.
+    # color is expected lowercase; --color is lowercased by argparse
     for i in range(1, timeline.GetTrackCount('video') + 1):
         if track and i != track:
             continue
-        items = timeline.GetItemListInTrack('video', i)
-        if items:
-            for item in items:
-                if color and (not item.GetClipColor() or item.GetClipColor().lower() != color.lower()):
+        for item in timeline.GetItemListInTrack('video', i) or []:
+            if color:
+                c = item.GetClipColor()
+                if not c or c.lower() != color:
                     continue
-                clips.append(item)
-    return clips
+            yield item
 
 def apply_look(clip, cdl_data):
     try:
@@ -126,22 +169,20 @@ def apply_look(clip, cdl_data):
 
 def main():
     parser = argparse.ArgumentParser(description="Quick Look Presets")
-    parser.add_argument('--look', choices=LOOK_PRESETS.keys(), help='Look preset to apply')
+    parser.add_argument('--look', choices=tuple(LOOK_PRESETS), help='Look preset to apply')
     parser.add_argument('--list-looks', action='store_true', help='List available looks')
     parser.add_argument('--all', action='store_true')
     parser.add_argument('--track', type=int)
-    parser.add_argument('--color', type=str)
+    parser.add_argument('--color', type=str.lower)
     parser.add_argument('--dry-run', action='store_true')
+    parser.add_argument('--jobs', type=int, default=1)
     args = parser.parse_args()
 
     if args.list_looks:
-        print("=" * 70)
+        print(SEPARATOR)
         print("Available Quick Looks")
-        print("=" * 70)
-        for key, data in LOOK_PRESETS.items():
-            print(f"\n{key}:")
-            print(f"  {data['name']}")
-            print(f"  {data['desc']}")
+        print(SEPARATOR)
+        print(LOOKS_LISTING)
         return
 
     if not args.look:
@@ -155,8 +196,7 @@ def main():
     print(f"Applying look: {LOOK_PRESETS[args.look]['name']}")
 
     try:
-        import DaVinciResolveScript as dvr
-        timeline = dvr.scriptapp("Resolve").GetProjectManager().GetCurrentProject().GetCurrentTimeline()
+        timeline = _connect_resolve().GetProjectManager().GetCurrentProject().GetCurrentTimeline()
         if not timeline:
             print("❌ No timeline")
             sys.exit(1)
@@ -164,21 +204,40 @@ def main():
         print("❌ Connection failed")
         sys.exit(1)
 
-    clips = get_clips(timeline, args.all, args.track, args.color)
-    if not clips:
+    clips = iter_clips(timeline, args.track, args.color)
+
+    if args.dry_run:
+        # Nothing is sent to Resolve: report the targets in one write
+        names = [clip.GetName() for clip in clips]
+        if not names:
+            print("❌ No clips")
+            sys.exit(1)
+        _write_lines([f"  Would apply to: {name}" for name in names])
+        print(f"\n{len(names)} clips processed")
+        return
+
+    cdl = make_cdl_payload(LOOK_PRESETS[args.look]['cdl'])
+    apply = lambda clip: (clip, apply_look(clip, cdl))
+    # Clips are handed to the workers as the tracks are walked
+    if args.jobs > 1:
+        with ThreadPoolExecutor(max_workers=args.jobs) as ex:
+            results = list(ex.map(apply, clips))
+    else:
+        results = [apply(clip) for clip in clips]
+    if not results:
         print("❌ No clips")
         sys.exit(1)
 
-    cdl = LOOK_PRESETS[args.look]['cdl']
     applied = 0
-    for clip in clips:
-        if args.dry_run:
-            print(f"  Would apply to: {clip.GetName()}")
-            applied += 1
-        else:
-            if apply_look(clip, cdl):
-                print(f"  ✅ {clip.GetName()}")
-                applied += 1
+    lines = []
+    for clip, ok in results:
+        if not ok:
+            continue
+        lines.append(f"  ✅ {clip.GetName()}")
+        applied += 1
+        if len(lines) >= OUTPUT_FLUSH_LINES:
+            _write_lines(lines)
+    _write_lines(lines)
     print(f"\n{applied} clips processed")
 
 if __name__ == "__main__":